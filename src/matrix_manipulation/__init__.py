@@ -0,0 +1,44 @@
+from importlib import import_module
+
+"""
+@author Jeremy Hopkins
+@author Iris Yang
+@version 0.1.0
+"""
+# Public names and the submodule that defines each. Submodules, and NumPy
+# with them, are only imported when one of their names is first accessed.
+_EXPORTS = {
+    "GaussElimination": "gauss",
+    "gauss_solve": "gauss",
+    "Cholesky": "cholesky",
+    "cholesky_solve": "cholesky",
+    "IterativeResult": "iterative",
+    "StationarySolver": "iterative",
+    "Jacobi": "iterative",
+    "GaussSeidel": "iterative",
+    "hilbert": "problems",
+    "hilbert_system": "problems",
+    "Laplace": "laplace",
+    "laplace_solve": "laplace",
+    "optimal_omega": "laplace",
+    "laplace_2d": "problems",
+    "laplace_eigenvector": "problems",
+    "diagonally_dominant": "problems",
+    "spd": "problems",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module("." + _EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(list(globals()) + __all__)
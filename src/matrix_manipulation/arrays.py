@@ -0,0 +1,30 @@
+import numpy as np
+
+"""
+@author Jeremy Hopkins
+@author Iris Yang
+@version 0.1.0
+"""
+def as_matrix(A: np.ndarray, overwrite: bool = False) -> np.ndarray:
+    """Return A as a square float64 array, the same array when `overwrite` allows it."""
+    if overwrite and isinstance(A, np.ndarray) and A.dtype == np.float64 and A.flags.c_contiguous:
+        M = A
+    else:
+        M = np.array(A, dtype=float)
+
+    assert M.ndim == 2 and M.shape[0] == M.shape[1], "A must be a square matrix"
+    assert M.shape[0] > 0, "A must not be empty"
+
+    return M
+
+
+def as_rhs(b: np.ndarray, n: int, overwrite: bool = False) -> np.ndarray:
+    """Return b as a float64 array of shape (n,) or (n, k)."""
+    if overwrite and isinstance(b, np.ndarray) and b.dtype == np.float64 and b.flags.c_contiguous:
+        x = b
+    else:
+        x = np.array(b, dtype=float)
+
+    assert x.ndim in (1, 2) and x.shape[0] == n, f"b must have shape ({n},) or ({n}, k)"
+
+    return x
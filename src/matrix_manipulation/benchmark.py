@@ -0,0 +1,172 @@
+import argparse
+import datetime
+import json
+import platform
+import sys
+import numpy as np
+from typing import Optional
+
+from .gauss import GaussElimination
+from .cholesky import Cholesky
+from .iterative import Jacobi, GaussSeidel
+from .problems import hilbert_system, diagonally_dominant, spd
+from .timing import measure
+
+"""
+@author Jeremy Hopkins
+@author Iris Yang
+@version 0.1.1
+"""
+# Every solver gets a matrix class it is guaranteed to handle: SPD for
+# Cholesky and strictly diagonally dominant for the iterative methods.
+SOLVERS = {
+    "numpy.linalg.solve": ("dominant", lambda A, b: np.linalg.solve(A, b)),
+    "gauss[none]": ("dominant", lambda A, b: GaussElimination(A, 'none').solve(b)),
+    "gauss[partial]": ("dominant", lambda A, b: GaussElimination(A, 'partial').solve(b)),
+    "gauss[scaled]": ("dominant", lambda A, b: GaussElimination(A, 'scaled').solve(b)),
+    "jacobi": ("dominant", lambda A, b: Jacobi(A, b, 1e-12).solve()),
+    "gauss_seidel": ("dominant", lambda A, b: GaussSeidel(A, b, 1e-12).solve()),
+    "numpy.linalg.solve[spd]": ("spd", lambda A, b: np.linalg.solve(A, b)),
+    "cholesky": ("spd", lambda A, b: Cholesky(A).solve(b)),
+}
+
+MATRICES = {
+    "dominant": diagonally_dominant,
+    "spd": spd,
+}
+
+
+def bench_solvers(methods: list[str], sizes: list[int], repeat: int) -> list[dict]:
+
+    results = []
+    for n in sizes:
+        systems = {kind: make(n) for kind, make in MATRICES.items()}
+
+        for method in methods:
+            kind, solve = SOLVERS[method]
+            A, b = systems[kind]
+            row = {"group": "solver", "method": method, "n": n, "matrix": kind}
+
+            x = solve(A, b)
+            row["residual"] = float(np.linalg.norm(b - A @ x) / np.linalg.norm(b))
+            row.update(measure(lambda: solve(A, b), repeat, min_time_ns=0))
+            results.append(row)
+
+    return results
+
+
+def bench_reuse(sizes: list[int], rhs: int, repeat: int) -> list[dict]:
+    """Factor once and solve `rhs` right-hand sides, against numpy.linalg.solve on the batch."""
+    results = []
+    for n in sizes:
+        A, _ = spd(n)
+        B = np.random.default_rng(1).uniform(-1.0, 1.0, (n, rhs))
+        factor = Cholesky(A)
+
+        solvers = {
+            f"numpy.linalg.solve[{rhs} rhs]": lambda: np.linalg.solve(A, B),
+            f"cholesky.solve[{rhs} rhs]": lambda: factor.solve(B),
+            "cholesky[factor]": lambda: Cholesky(A),
+        }
+        for method, solve in solvers.items():
+            row = {"group": "reuse", "method": method, "n": n, "matrix": "spd"}
+            X = solve()
+            if isinstance(X, np.ndarray):
+                row["residual"] = float(np.linalg.norm(B - A @ X) / np.linalg.norm(B))
+            else:
+                row["residual"] = "-"
+            row.update(measure(solve, repeat, min_time_ns=0))
+            results.append(row)
+
+    return results
+
+
+def bench_hilbert(sizes: list[int]) -> list[dict]:
+    """Solution error of the direct methods on the Hilbert test case."""
+    results = []
+    for n in sizes:
+        A, b, x = hilbert_system(n)
+        solvers = {
+            "numpy.linalg.solve": lambda: np.linalg.solve(A, b),
+            "gauss[none]": lambda: GaussElimination(A, 'none').solve(b),
+            "gauss[partial]": lambda: GaussElimination(A, 'partial').solve(b),
+            "gauss[scaled]": lambda: GaussElimination(A, 'scaled').solve(b),
+            "cholesky": lambda: Cholesky(A).solve(b),
+        }
+
+        for method, solve in solvers.items():
+            row = {"group": "hilbert", "method": method, "n": n, "matrix": "hilbert"}
+            try:
+                row["error"] = float(np.linalg.norm(solve() - x))
+            except np.linalg.LinAlgError as e:
+                row["error"] = f"LinAlgError: {e}"
+            results.append(row)
+
+        try:
+            results[-1]["cond"] = Cholesky(A).cond()
+        except np.linalg.LinAlgError:
+            pass
+
+    return results
+
+
+def run(
+    methods: Optional[list[str]] = None,
+    sizes: Optional[list[int]] = None,
+    hilbert: Optional[list[int]] = None,
+    repeat: int = 5,
+    rhs: int = 1000
+) -> dict:
+    """Run the suite and return a JSON-serialisable report."""
+    if methods is None:
+        methods = list(SOLVERS)
+    if sizes is None:
+        sizes = [100, 400, 1000]
+    if hilbert is None:
+        hilbert = [8, 10, 13]
+
+    return {
+        "created": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "python": sys.version.split()[0],
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "results": bench_solvers(methods, sizes, repeat) + bench_reuse(sizes, rhs, repeat) + bench_hilbert(hilbert),
+    }
+
+
+def format_report(report: dict) -> str:
+
+    lines = [f"{'method':<30}{'n':>6}  {'matrix':<10}{'median':>12}{'min':>12}  residual / error"]
+    for row in report["results"]:
+        if "median_ns" in row:
+            timing = f"{row['median_ns']/1e6:>10.3f}ms{row['min_ns']/1e6:>10.3f}ms"
+            accuracy = row["residual"]
+        else:
+            timing = f"{'-':>12}{'-':>12}"
+            accuracy = row["error"]
+        if isinstance(accuracy, float):
+            accuracy = f"{accuracy:.3e}"
+        if "cond" in row:
+            accuracy += f"  (cond estimate {row['cond']:.3e})"
+        lines.append(f"{row['method']:<30}{row['n']:>6}  {row['matrix']:<10}{timing}  {accuracy}")
+
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description="Benchmark the linear solvers against numpy.linalg.solve.")
+    parser.add_argument("--methods", nargs="+", choices=list(SOLVERS), default=list(SOLVERS))
+    parser.add_argument("--sizes", nargs="+", type=int, default=[100, 400, 1000])
+    parser.add_argument("--hilbert", nargs="+", type=int, default=[8, 10, 13])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--rhs", type=int, default=1000, help="right-hand sides per factorization")
+    parser.add_argument("--out", default=None, help="write the JSON report to this file")
+    args = parser.parse_args()
+
+    report = run(args.methods, args.sizes, args.hilbert, args.repeat, args.rhs)
+    print(format_report(report))
+
+    if args.out is not None:
+        with open(args.out, "w") as fh:
+            json.dump(report, fh, indent=2)
@@ -0,0 +1,115 @@
+import numpy as np
+from typing import Optional
+
+from .arrays import as_matrix, as_rhs
+
+"""
+@author Jeremy Hopkins
+@author Iris Yang
+@version 0.1.0
+"""
+class GaussElimination():
+    """LU factorization by Gaussian elimination, reusable for many right-hand sides.
+
+        The factorization is computed in place in a single n x n array, the
+        multipliers below the diagonal and U on and above it, with each
+        elimination step done as one vectorized rank-1 update into a
+        preallocated work buffer. Row swaps are applied to whole rows and
+        recorded in `perm`.
+
+    """
+
+    __slots__ = ("lu", "perm", "pivot", "n", "swaps")
+
+    def __init__(self, A: np.ndarray, pivot: Optional[str] = None, overwrite: bool = False):
+        """Construct `GaussElimination`
+
+            Args:
+                A: Square matrix to factor.
+                pivot: 'none', 'partial' to bring the largest entry of the
+                    column to the diagonal, or 'scaled' to compare entries
+                    relative to the largest entry of their row.
+                overwrite: Factor A in place when it is already a float64
+                    array, instead of working on a copy.
+
+        """
+        if pivot is None:
+            pivot = 'partial'
+
+        assert pivot in ('none', 'partial', 'scaled'), "pivot must be 'none', 'partial' or 'scaled'"
+        self.pivot = pivot
+
+        self.lu = as_matrix(A, overwrite)
+        self.n = len(self.lu)
+        self.perm = np.arange(self.n)
+        self.swaps = 0
+
+        self._factor()
+
+
+    def _factor(self) -> None:
+
+        lu, perm, n = self.lu, self.perm, self.n
+        work = np.empty((n, n))
+
+        if self.pivot == 'scaled':
+            scale = np.abs(lu).max(axis=1)
+            if not np.all(scale > 0):
+                raise np.linalg.LinAlgError("matrix has a zero row")
+
+        for i in range(n - 1):
+            if self.pivot == 'partial':
+                p = i + np.argmax(np.abs(lu[i:, i]))
+            elif self.pivot == 'scaled':
+                p = i + np.argmax(np.abs(lu[i:, i]) / scale[i:])
+            else:
+                p = i
+
+            if p != i:
+                lu[[i, p]] = lu[[p, i]]
+                perm[[i, p]] = perm[[p, i]]
+                if self.pivot == 'scaled':
+                    scale[[i, p]] = scale[[p, i]]
+                self.swaps += 1
+
+            if lu[i, i] == 0:
+                raise np.linalg.LinAlgError(f"zero pivot in column {i}, matrix is singular")
+
+            m = lu[i + 1:, i]
+            m /= lu[i, i]
+
+            k = n - i - 1
+            np.multiply(m[:, None], lu[i, i + 1:], out=work[:k, :k])
+            lu[i + 1:, i + 1:] -= work[:k, :k]
+
+        if lu[n - 1, n - 1] == 0:
+            raise np.linalg.LinAlgError(f"zero pivot in column {n - 1}, matrix is singular")
+
+
+    def solve(self, b: np.ndarray, overwrite: bool = False) -> np.ndarray:
+        """Solve A x = b for a right-hand side of shape (n,) or (n, k)."""
+        x = as_rhs(b, self.n, overwrite)
+        squeeze = x.ndim == 1
+        x = x.reshape(self.n, -1)
+
+        x[:] = x[self.perm]
+        lu = self.lu
+
+        # Forward substitution with the unit lower triangle, then back
+        # substitution with U, one column of the factor at a time.
+        for i in range(self.n - 1):
+            x[i + 1:] -= lu[i + 1:, i, None] * x[i]
+        for i in range(self.n - 1, -1, -1):
+            x[i] /= lu[i, i]
+            x[:i] -= lu[:i, i, None] * x[i]
+
+        return x[:, 0] if squeeze else x
+
+
+    def det(self) -> float:
+        return (-1)**self.swaps * np.prod(np.diag(self.lu))
+
+
+def gauss_solve(A: np.ndarray, b: np.ndarray, pivot: Optional[str] = None) -> np.ndarray:
+    """Solve A x = b by Gaussian elimination, see `GaussElimination`."""
+    return GaussElimination(A, pivot).solve(b)
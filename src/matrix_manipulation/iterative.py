@@ -0,0 +1,133 @@
+import numpy as np
+from typing import NamedTuple, Optional, Union
+
+from .arrays import as_matrix, as_rhs
+
+"""
+@author Jeremy Hopkins
+@author Iris Yang
+@version 0.1.0
+"""
+class IterativeResult(NamedTuple):
+
+    x: np.ndarray
+    iterations: int
+    residual: float
+    converged: bool
+
+
+class StationarySolver():
+    """Driver shared by the stationary iterative methods.
+
+        Subclasses implement `sweep`, which overwrites `x` with the next
+        approximation. Iteration stops once the relative residual
+        ||b - A x|| / ||b|| falls below `error` or after `max_iter` sweeps.
+        The methods converge for strictly diagonally dominant A, and
+        Gauss-Seidel also for symmetric positive definite A.
+
+    """
+
+    __slots__ = ("A", "b", "n", "error", "max_iter", "x", "count", "residual")
+
+    def __init__(
+        self,
+        A: np.ndarray,
+        b: np.ndarray,
+        error: Optional[Union[int, float]] = None,
+        max_iter: Optional[int] = None,
+        x0: Optional[np.ndarray] = None
+    ):
+        """Construct the solver
+
+            Args:
+                A: Square matrix with a nonzero diagonal.
+                b: Right-hand side of shape (n,).
+                error: Bound on the relative residual.
+                max_iter: Maximum number of sweeps.
+                x0: Starting approximation, zero when omitted.
+
+        """
+        self.A = as_matrix(A)
+        self.n = len(self.A)
+        assert np.all(np.diag(self.A) != 0), "A must have a nonzero diagonal"
+
+        self.b = as_rhs(b, self.n)
+        assert self.b.ndim == 1, "b must be a vector"
+
+        if error is None:
+            error = 1e-10
+
+        assert isinstance(error, (int, float)) and error > 0, "error must be a positive int or float"
+        self.error = error
+
+        if max_iter is None:
+            max_iter = 10_000
+
+        assert isinstance(max_iter, int) and max_iter > 0, "max_iter must be a positive int"
+        self.max_iter = max_iter
+
+        self.x = np.zeros(self.n) if x0 is None else as_rhs(x0, self.n).copy()
+        self.count = 0
+        self.residual = np.inf
+
+
+    def run(self) -> IterativeResult:
+
+        A, b, x = self.A, self.b, self.x
+        r = np.empty(self.n)
+        norm_b = np.linalg.norm(b) or 1.0
+
+        self.count = 0
+        while True:
+            np.subtract(b, A @ x, out=r)
+            self.residual = np.linalg.norm(r) / norm_b
+
+            if self.residual < self.error or self.count >= self.max_iter:
+                break
+
+            self.sweep(x)
+            self.count += 1
+
+        return IterativeResult(x, self.count, self.residual, self.residual < self.error)
+
+
+    def solve(self) -> np.ndarray:
+        return self.run().x
+
+
+    def sweep(self, x: np.ndarray) -> None:
+        raise NotImplementedError
+
+
+class Jacobi(StationarySolver):
+    """Jacobi iteration x <- D^-1 (b - (A - D) x), one matrix-vector product per sweep."""
+
+    __slots__ = ("d", "R")
+
+    def __init__(self, A, b, error=None, max_iter=None, x0=None):
+        super().__init__(A, b, error, max_iter, x0)
+
+        self.d = np.diag(self.A).copy()
+        self.R = self.A.copy()
+        np.fill_diagonal(self.R, 0.0)
+
+
+    def sweep(self, x: np.ndarray) -> None:
+        x[:] = (self.b - self.R @ x) / self.d
+
+
+class GaussSeidel(StationarySolver):
+    """Gauss-Seidel iteration, using every updated entry of x as soon as it is known.
+
+        The sweep is inherently sequential over the rows, so each row is one
+        dot product with the current x.
+
+    """
+
+    __slots__ = ()
+
+    def sweep(self, x: np.ndarray) -> None:
+
+        A, b = self.A, self.b
+        for i in range(self.n):
+            x[i] += (b[i] - A[i] @ x) / A[i, i]
@@ -0,0 +1,226 @@
+import numpy as np
+from typing import Optional, Union
+
+from .iterative import IterativeResult
+
+"""
+@author Jeremy Hopkins
+@author Iris Yang
+@version 0.1.0
+"""
+class Laplace():
+    """Matrix-free iterative solver for the 2-D 5-point Laplace system.
+
+        Solves L u = f on an ny x nx grid with zero Dirichlet boundary
+        values, where L has -4 on the diagonal and 1 for each horizontal and
+        vertical neighbour, the matrix `laplace_2d` builds densely. Only the
+        grid is stored, padded with its boundary, so memory is O(N) for N
+        unknowns.
+
+        'jacobi' updates every point from a copy of the previous sweep with
+        array shifts. 'gauss_seidel' and 'sor' use red-black ordering: all
+        red points, whose neighbours are all black, are updated at once
+        from the black ones and then the other way round, so each half
+        sweep is vectorized. SOR over-relaxes every update by `omega`.
+
+        The relative residual ||f - L u|| / ||f|| is checked every `check`
+        sweeps and iteration stops once it falls below `error`.
+
+    """
+
+    __slots__ = (
+        "f", "shape", "method", "omega", "error", "max_iter", "check",
+        "count", "residual", "_pad", "_colors"
+    )
+
+    def __init__(
+        self,
+        f: np.ndarray,
+        method: Optional[str] = None,
+        omega: Optional[float] = None,
+        error: Optional[Union[int, float]] = None,
+        max_iter: Optional[int] = None,
+        u0: Optional[np.ndarray] = None,
+        check: Optional[int] = None
+    ):
+        """Construct `Laplace`
+
+            Args:
+                f: Right-hand side on the grid, shape (ny, nx). A vector from
+                    the C++ program is reshaped to (nodes, nodes) first.
+                method: 'jacobi', 'gauss_seidel' or 'sor'.
+                omega: SOR relaxation factor in (0, 2), the optimal factor for
+                    the grid when omitted.
+                error: Bound on the relative residual.
+                max_iter: Maximum number of sweeps.
+                u0: Starting approximation, zero when omitted, flat or of
+                    the shape of f.
+                check: Number of sweeps between residual checks.
+
+        """
+        self.f = np.array(f, dtype=float)
+        if self.f.ndim == 1:
+            nodes = int(round(np.sqrt(self.f.size)))
+            assert nodes * nodes == self.f.size, "a flat f must hold nodes * nodes values"
+            self.f = self.f.reshape(nodes, nodes)
+        assert self.f.ndim == 2 and self.f.size > 0, "f must be a non-empty 2-D grid"
+        self.shape = self.f.shape
+
+        if method is None:
+            method = 'sor'
+
+        assert method in ('jacobi', 'gauss_seidel', 'sor'), "method must be 'jacobi', 'gauss_seidel' or 'sor'"
+        self.method = method
+
+        if method != 'sor':
+            assert omega is None, "omega is only used by sor"
+            omega = 1.0
+        elif omega is None:
+            omega = optimal_omega(self.shape)
+
+        assert isinstance(omega, (int, float)) and 0 < omega < 2, "omega must be in (0, 2)"
+        self.omega = omega
+
+        if error is None:
+            error = 1e-8
+
+        assert isinstance(error, (int, float)) and error > 0, "error must be a positive int or float"
+        self.error = error
+
+        if max_iter is None:
+            max_iter = 100_000
+
+        assert isinstance(max_iter, int) and max_iter > 0, "max_iter must be a positive int"
+        self.max_iter = max_iter
+
+        if check is None:
+            check = 10
+
+        assert isinstance(check, int) and check > 0, "check must be a positive int"
+        self.check = check
+
+        ny, nx = self.shape
+        self._pad = np.zeros((ny + 2, nx + 2))
+        if u0 is not None:
+            u0 = np.asarray(u0, dtype=float)
+            if u0.ndim == 1 and u0.size == self.f.size:
+                u0 = u0.reshape(self.shape)
+            assert u0.shape == self.shape, "u0 must have the shape of f"
+            self._pad[1:-1, 1:-1] = u0
+
+        self._colors = [_sublattices(self.shape, c) for c in (0, 1)]
+        self.count = 0
+        self.residual = np.inf
+
+
+    @property
+    def u(self) -> np.ndarray:
+        return self._pad[1:-1, 1:-1]
+
+
+    def apply(self, u: np.ndarray) -> np.ndarray:
+        """Return L u without forming L."""
+        P = np.zeros((u.shape[0] + 2, u.shape[1] + 2))
+        P[1:-1, 1:-1] = u
+        return _neighbours(P) - 4.0 * u
+
+
+    def run(self) -> IterativeResult:
+
+        f = self.f
+        norm_f = np.linalg.norm(f) or 1.0
+        sweep = self._jacobi() if self.method == 'jacobi' else self._red_black()
+
+        self.count = 0
+        while True:
+            if self.count % self.check == 0 or self.count >= self.max_iter:
+                self.residual = np.linalg.norm(f - _neighbours(self._pad) + 4.0 * self.u) / norm_f
+                if self.residual < self.error or self.count >= self.max_iter:
+                    break
+
+            next(sweep)
+            self.count += 1
+
+        return IterativeResult(self.u.copy(), self.count, self.residual, self.residual < self.error)
+
+
+    def solve(self) -> np.ndarray:
+        return self.run().x
+
+
+    def _jacobi(self):
+
+        P, f = self._pad, self.f
+        Q = P.copy()
+
+        while True:
+            # Q keeps the zero boundary, only its interior is written.
+            np.subtract(_neighbours(P), f, out=Q[1:-1, 1:-1])
+            Q[1:-1, 1:-1] *= 0.25
+            P[1:-1, 1:-1] = Q[1:-1, 1:-1]
+            yield
+
+
+    def _red_black(self):
+
+        P, f, omega = self._pad, self.f, self.omega
+        bufs = [[np.empty(_shape(rows, cols)) for rows, cols in color] for color in self._colors]
+
+        while True:
+            for color, buf in zip(self._colors, bufs):
+                for (rows, cols), b in zip(color, buf):
+                    # u <- (1 - omega) u + omega (sum of neighbours - f) / 4
+                    up, down = slice(rows.start - 1, rows.stop - 1, 2), slice(rows.start + 1, rows.stop + 1, 2)
+                    left, right = slice(cols.start - 1, cols.stop - 1, 2), slice(cols.start + 1, cols.stop + 1, 2)
+                    np.add(P[up, cols], P[down, cols], out=b)
+                    b += P[rows, left]
+                    b += P[rows, right]
+                    b -= f[rows.start - 1:rows.stop - 1:2, cols.start - 1:cols.stop - 1:2]
+                    b *= 0.25 * omega
+                    U = P[rows, cols]
+                    if omega != 1.0:
+                        U *= 1.0 - omega
+                        U += b
+                    else:
+                        U[...] = b
+            yield
+
+
+def optimal_omega(shape: tuple[int, int]) -> float:
+    """Return the optimal SOR factor 2/(1 + sqrt(1 - rho^2)) for an ny x nx grid.
+
+        rho is the spectral radius of the Jacobi iteration for the 5-point
+        Laplacian, the mean of cos(pi/(ny + 1)) and cos(pi/(nx + 1)).
+
+    """
+    ny, nx = shape
+    rho = (np.cos(np.pi/(ny + 1)) + np.cos(np.pi/(nx + 1))) / 2
+    return 2.0 / (1.0 + np.sqrt(1.0 - rho*rho))
+
+
+def laplace_solve(f: np.ndarray, method: Optional[str] = None, error: Optional[float] = None) -> np.ndarray:
+    """Solve the 5-point Laplace system L u = f on a grid, see `Laplace`."""
+    return Laplace(f, method, error=error).solve()
+
+
+def _neighbours(P: np.ndarray) -> np.ndarray:
+    return P[:-2, 1:-1] + P[2:, 1:-1] + P[1:-1, :-2] + P[1:-1, 2:]
+
+
+def _sublattices(shape: tuple[int, int], color: int) -> list[tuple[slice, slice]]:
+
+    # Interior point (i, j) is P[i + 1, j + 1] and has color (i + j) % 2. The
+    # points of one color are the union of two strided sub-lattices.
+    ny, nx = shape
+    out = []
+    for r in (0, 1):
+        c = (color + r) % 2
+        rows, cols = slice(1 + r, ny + 1, 2), slice(1 + c, nx + 1, 2)
+        if _shape(rows, cols)[0] and _shape(rows, cols)[1]:
+            out.append((rows, cols))
+
+    return out
+
+
+def _shape(rows: slice, cols: slice) -> tuple[int, int]:
+    return len(range(rows.start, rows.stop, 2)), len(range(cols.start, cols.stop, 2))
@@ -0,0 +1,72 @@
+import numpy as np
+
+"""
+@author Jeremy Hopkins
+@author Iris Yang
+@version 0.1.0
+"""
+def hilbert(n: int) -> np.ndarray:
+    """Return the n x n Hilbert matrix, A[i, j] = 1/(i + j + 1)."""
+    i = np.arange(n)
+    return 1.0 / (i[:, None] + i + 1.0)
+
+
+def hilbert_system(n: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return `(A, b, x)` for the Hilbert test case of the C++ programs.
+
+        The solution is the 8th minus 2 times the 4th unit vector, so b is
+        the 8th minus 2 times the 4th column of A. This needs n >= 8.
+
+    """
+    assert isinstance(n, int) and n >= 8, "n must be an int of at least 8"
+
+    A = hilbert(n)
+    x = np.zeros(n)
+    x[3] = -2.0
+    x[7] = 1.0
+
+    return A, A[:, 7] - 2.0 * A[:, 3], x
+
+
+def laplace_2d(nodes: int) -> np.ndarray:
+    """Return the dense 5-point Laplacian on a nodes x nodes grid.
+
+        The matrix has -4 on the diagonal and 1 for every horizontal and
+        vertical neighbour, with zero Dirichlet boundary values.
+
+    """
+    n = nodes * nodes
+    A = -4.0 * np.eye(n)
+
+    i = np.arange(n - 1)
+    same_row = (i + 1) % nodes != 0
+    A[i[same_row], i[same_row] + 1] = 1.0
+    A[i[same_row] + 1, i[same_row]] = 1.0
+
+    i = np.arange(n - nodes)
+    A[i, i + nodes] = 1.0
+    A[i + nodes, i] = 1.0
+
+    return A
+
+
+def laplace_eigenvector(nodes: int, kx: int, ky: int) -> np.ndarray:
+    """Return the (kx, ky) eigenvector sin(kx x) sin(ky y) of `laplace_2d` with h = pi/(nodes + 1)."""
+    h = np.pi / (nodes + 1.0)
+    t = np.arange(1, nodes + 1) * h
+    return np.outer(np.sin(kx * t), np.sin(ky * t)).ravel()
+
+
+def diagonally_dominant(n: int, seed: int = 0) -> tuple[np.ndarray, np.ndarray]:
+    """Return a random strictly diagonally dominant matrix and right-hand side."""
+    rng = np.random.default_rng(seed)
+    A = rng.uniform(-1.0, 1.0, (n, n))
+    A[np.diag_indices(n)] = np.abs(A).sum(axis=1) + 1.0
+    return A, rng.uniform(-1.0, 1.0, n)
+
+
+def spd(n: int, seed: int = 0) -> tuple[np.ndarray, np.ndarray]:
+    """Return a random symmetric positive definite matrix and right-hand side."""
+    rng = np.random.default_rng(seed)
+    M = rng.uniform(-1.0, 1.0, (n, n))
+    return M @ M.T + n * np.eye(n), rng.uniform(-1.0, 1.0, n)
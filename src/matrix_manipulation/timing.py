@@ -0,0 +1,43 @@
+import time
+import numpy as np
+
+"""
+@author Jeremy Hopkins
+@author Iris Yang
+@version 0.1.0
+"""
+def measure(func: callable, repeat: int = 30, min_time_ns: int = 200_000) -> dict:
+    """Time `func` with `perf_counter_ns` and return per-call statistics in nanoseconds.
+
+        `func` is called once untimed to warm up. The number of calls per
+        sample is doubled until a sample takes at least `min_time_ns`, so
+        runs of a few microseconds are not dominated by timer resolution.
+
+    """
+    func()
+
+    number = 1
+    while True:
+        start = time.perf_counter_ns()
+        for _ in range(number):
+            func()
+        if time.perf_counter_ns() - start >= min_time_ns:
+            break
+        number *= 2
+
+    samples = np.empty(repeat)
+    for i in range(repeat):
+        start = time.perf_counter_ns()
+        for _ in range(number):
+            func()
+        samples[i] = (time.perf_counter_ns() - start) / number
+
+    q1, median, q3 = np.percentile(samples, [25, 50, 75])
+
+    return {
+        "min_ns": float(samples.min()),
+        "median_ns": float(median),
+        "iqr_ns": float(q3 - q1),
+        "repeat": repeat,
+        "number": number,
+    }
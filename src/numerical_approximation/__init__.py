@@ -0,0 +1,70 @@
+from importlib import import_module
+
+"""
+@author Jeremy Hopkins
+@author Iris Yang
+@version 0.1.0
+"""
+# Public names and the submodule that defines each. Submodules, and NumPy
+# with them, are only imported when one of their names is first accessed.
+_EXPORTS = {
+    "RootFinder": "root_finder",
+    "SolverResult": "root_finder",
+    "Status": "root_finder",
+    "Iterate": "root_finder",
+    "Evaluate": "root_finder",
+    "evaluate_async": "root_finder",
+    "run_all": "root_finder",
+    "Bisection": "bisection",
+    "BatchBisection": "bisection",
+    "Secant": "secant",
+    "FalsePosition": "false_position",
+    "Newton": "newton",
+    "Steffensen": "steffensen",
+    "Brent": "brent",
+    "NewtonSystem": "newton_system",
+    "BatchNewtonSystem": "newton_system",
+    "Horner": "horner",
+    "horner_eval": "horner",
+    "BatchPolynomialRoots": "horner",
+    "Dual": "dual",
+    "dual_derivative": "dual",
+    "fd_derivative": "dual",
+    "History": "history",
+    "EvalCache": "cache",
+    "CacheInfo": "cache",
+    "find_roots": "scan",
+    "Chebyshev": "chebyshev",
+    "chebyshev_roots": "chebyshev",
+    "afind_roots": "scan",
+    "Event": "instrument",
+    "TraceCollector": "instrument",
+    "estimate_order": "instrument",
+    "trace_order": "instrument",
+    "BasinMap": "basin",
+    "basin_map": "basin",
+    "plot_history": "plotting",
+    "render_each": "plotting",
+    "render_grid": "plotting",
+    "METHODS": "registry",
+    "MethodInfo": "registry",
+    "register": "registry",
+    "choose": "registry",
+    "solve": "registry",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module("." + _EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(list(globals()) + __all__)
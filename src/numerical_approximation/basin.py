@@ -0,0 +1,182 @@
+import numpy as np
+from typing import NamedTuple, Optional, Union
+
+from .dual import dual_derivative, fd_derivative
+
+"""
+@author Jeremy Hopkins
+@author Iris Yang
+@version 0.1.0
+"""
+class BasinMap(NamedTuple):
+    """Result of `basin_map`.
+
+        `labels` and `iterations` have the shape of the starting points.
+        `labels[i]` indexes `roots` for a start that converged and is -1 for
+        one that reached `max_iter`, diverged or hit a zero derivative.
+        `iterations` counts approximations the same way `RootFinder.count`
+        does, so a start that is already a root counts 1.
+
+    """
+    labels: np.ndarray
+    iterations: np.ndarray
+    roots: np.ndarray
+
+
+def basin_map(
+    f: callable,
+    starts: np.ndarray,
+    method: str = 'newton',
+    error: Optional[Union[int, float]] = None,
+    max_iter: Optional[int] = None,
+    roots: Optional[np.ndarray] = None,
+    tol: Optional[float] = None,
+    fprime: Optional[callable] = None,
+    chunk: Optional[int] = None
+) -> BasinMap:
+    """Run Newton or Steffensen from every point of `starts` at once.
+
+        f is evaluated on whole arrays of starting points, so it must be
+        vectorized. Lanes are dropped from the working set as soon as they
+        stop, and the points are processed `chunk` at a time so the working
+        memory stays bounded regardless of the size of the grid. With
+        complex starting points, for example a 2-D grid of the complex
+        plane, the iteration runs in complex arithmetic and maps the classic
+        Newton basins.
+
+        Args:
+            f: Vectorized callable representation of function to be estimated.
+            starts: Starting values, an array of any shape.
+            method: 'newton' or 'steffensen'.
+            error: Error bounds.
+            max_iter: Maximum number of approximations per start.
+            roots: Known roots to label against. When omitted the roots are
+                collected from the converged lanes in order of discovery.
+            tol: Distance within which a converged lane belongs to a root.
+            fprime: Vectorized derivative of f, for Newton. When omitted the
+                derivative is computed with dual numbers, falling back to a
+                central difference if f does not support them.
+            chunk: Number of starting points iterated together.
+
+    """
+    assert callable(f), "f must be callable"
+    assert method in ('newton', 'steffensen'), "method must be 'newton' or 'steffensen'"
+    assert fprime is None or method == 'newton', "fprime is only used by newton"
+
+    if error is None:
+        error = 1e-12
+    assert isinstance(error, (int, float)) and error > 0, "error must be a positive int or float"
+
+    if max_iter is None:
+        max_iter = 100
+    assert isinstance(max_iter, int) and max_iter > 0, "max_iter must be a positive int"
+
+    if tol is None:
+        tol = 1e-6
+    assert isinstance(tol, (int, float)) and tol > 0, "tol must be a positive int or float"
+
+    if chunk is None:
+        chunk = 2**18
+    assert isinstance(chunk, int) and chunk > 0, "chunk must be a positive int"
+
+    starts = np.asarray(starts)
+    dtype = complex if np.iscomplexobj(starts) else float
+    flat = starts.reshape(-1)
+
+    labels = np.empty(flat.shape, dtype=np.int32)
+    iterations = np.empty(flat.shape, dtype=np.int32)
+    found = [] if roots is None else list(np.asarray(roots, dtype=dtype))
+    step = _newton_step(f, fprime) if method == 'newton' else _steffensen_step(f)
+
+    with np.errstate(all='ignore'):
+        for lo in range(0, flat.size, chunk):
+            hi = min(lo + chunk, flat.size)
+            x, count, converged = _iterate(step, flat[lo:hi].astype(dtype), error, max_iter)
+            labels[lo:hi] = _label(x, converged, found, tol, roots is None)
+            iterations[lo:hi] = count
+
+    return BasinMap(labels.reshape(starts.shape), iterations.reshape(starts.shape), np.array(found, dtype=dtype))
+
+
+def _iterate(step: callable, x: np.ndarray, error: float, max_iter: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+
+    count = np.full(x.shape, max_iter, dtype=np.int32)
+    converged = np.zeros(x.shape, dtype=bool)
+
+    # The working set is kept compact, lanes are only written back once
+    # they stop.
+    idx = np.arange(x.size)
+    xa = x.copy()
+
+    for k in range(1, max_iter + 1):
+        fx, x_new = step(xa)
+
+        done = np.abs(fx) < error
+        stop = done | ~np.isfinite(x_new)
+        if stop.any():
+            x[idx[stop]] = xa[stop]
+            count[idx[stop]] = k
+            converged[idx[done]] = True
+            keep = ~stop
+            idx, xa, x_new = idx[keep], xa[keep], x_new[keep]
+
+        if idx.size == 0 or k == max_iter:
+            break
+        xa = x_new
+
+    # Lanes that ran out of iterations keep their last approximation.
+    x[idx] = xa
+
+    return x, count, converged
+
+
+def _newton_step(f: callable, fprime: Optional[callable]) -> callable:
+
+    use_dual = fprime is None
+
+    def step(x):
+        nonlocal use_dual
+        if fprime is not None:
+            fx, d = f(x), fprime(x)
+        else:
+            if use_dual:
+                try:
+                    fx, d = dual_derivative(f, x)
+                except TypeError:
+                    use_dual = False
+            if not use_dual:
+                fx, d = f(x), fd_derivative(f, x)
+        return fx, x - fx/d
+
+    return step
+
+
+def _steffensen_step(f: callable) -> callable:
+
+    def step(x):
+        fx = f(x)
+        g = f(x + fx)/fx - 1
+        return fx, x - fx/g
+
+    return step
+
+
+def _label(x: np.ndarray, converged: np.ndarray, found: list, tol: float, grow: bool) -> np.ndarray:
+
+    labels = np.full(x.shape, -1, dtype=np.int32)
+    todo = np.flatnonzero(converged)
+
+    for i, root in enumerate(found):
+        near = np.abs(x[todo] - root) <= tol
+        labels[todo[near]] = i
+        todo = todo[~near]
+
+    # Any converged lane left over starts a new root.
+    while grow and todo.size:
+        root = x[todo[0]]
+        near = np.abs(x[todo] - root) <= tol
+        labels[todo[near]] = len(found)
+        found.append(root)
+        todo = todo[~near]
+
+    return labels
@@ -0,0 +1,219 @@
+import argparse
+import datetime
+import json
+import platform
+import sys
+import time
+import numpy as np
+from typing import Optional
+
+from .bisection import Bisection
+from .secant import Secant
+from .false_position import FalsePosition
+from .newton import Newton
+from .steffensen import Steffensen
+from .horner import Horner, horner_eval
+from .brent import Brent
+
+"""
+@author Jeremy Hopkins
+@author Iris Yang
+@version 0.1.2
+"""
+# Functions use NumPy ufuncs so Newton can differentiate them with dual numbers.
+PROBLEMS = [
+    dict(name="x²-2", f=lambda x: x**2 - 2, a=0, b=2, x=1, sol=np.sqrt(2)),
+    dict(name="x³", f=lambda x: x**3 - 0, a=-0.5, b=0.5, x=0.5, sol=0.0),
+    dict(name="x²-3", f=lambda x: x**2 - 3, a=1, b=2, x=2, sol=np.sqrt(3)),
+    dict(name="8x⁴-8x²+1", f=lambda x: 8*x**4 - 8*x**2 + 1, a=0.5, b=1.0, x=1.0, sol=np.cos(np.pi/8)),
+    dict(name="x⁴-6/7x²+3/35", f=lambda x: x**4 - 6/7*x**2 + 3/35, a=0.5, b=1.0, x=1.0, sol=0.8611363115940526),
+    dict(name="cos(x)-x", f=lambda x: np.cos(x) - x, a=0, b=1, x=1, sol=0.7390851332151607),
+    dict(name="x³-2x-5", f=lambda x: x**3 - 2*x - 5, a=2, b=3, x=2, sol=2.0945514815423265),
+    dict(name="e⁻ˣ-x", f=lambda x: np.exp(-x) - x, a=0, b=1, x=0, sol=0.5671432904097838),
+    dict(name="(x-1)³", f=lambda x: (x - 1)**3, a=0, b=2.5, x=2, sol=1.0),
+    dict(name="x¹⁰-1", f=lambda x: x**10 - 1, a=0, b=1.3, x=1.3, sol=1.0),
+]
+
+POLYNOMIALS = [
+    dict(name="8x⁴-8x²+1", poly=[8, 0, -8, 0, 1], a=-1.1, b=1.1),
+    dict(name="x⁴-6/7x²+3/35", poly=[1, 0, -6/7, 0, 3/35], a=-1.1, b=1.1),
+    dict(name="Π(x-k/10)", poly=list(np.poly(np.arange(-9, 10)/10)), a=-1.0, b=1.0),
+    dict(name="(x-1)²(x+2)", poly=list(np.poly([1, 1, -2])), a=-3.0, b=3.0),
+    dict(name="(x-.3)³(x-2)", poly=list(np.poly([0.3, 0.3, 0.3, 2])), a=-1.0, b=3.0),
+    dict(name="(x+.7)²(x-.1)³", poly=list(np.poly([-0.7, -0.7, 0.1, 0.1, 0.1])), a=-1.0, b=1.0),
+]
+
+# The secant class rejects tolerances below 0.01.
+SOLVERS = {
+    "bisection": lambda p, error: Bisection(p["f"], p["a"], p["b"], error),
+    "secant": lambda p, error: Secant(p["f"], p["a"], p["b"], max(error, 0.01), p["name"]),
+    "false_position": lambda p, error: FalsePosition(p["f"], p["a"], p["b"], error),
+    "false_position[illinois]": lambda p, error: FalsePosition(p["f"], p["a"], p["b"], error, mode='illinois'),
+    "false_position[pegasus]": lambda p, error: FalsePosition(p["f"], p["a"], p["b"], error, mode='pegasus'),
+    "false_position[anderson-bjorck]": lambda p, error: FalsePosition(p["f"], p["a"], p["b"], error, mode='anderson-bjorck'),
+    "newton": lambda p, error: Newton(p["f"], p["x"], error),
+    "steffensen": lambda p, error: Steffensen(p["f"], p["x"], error),
+    "brent": lambda p, error: Brent(p["f"], p["a"], p["b"], error),
+}
+
+
+def measure(func: callable, repeat: int = 30, min_time_ns: int = 200_000) -> dict:
+    """Time `func` with `perf_counter_ns` and return per-call statistics in nanoseconds.
+
+        `func` is called once untimed to warm up. The number of calls per
+        sample is doubled until a sample takes at least `min_time_ns`, so
+        runs of a few microseconds are not dominated by timer resolution.
+
+    """
+    func()
+
+    number = 1
+    while True:
+        start = time.perf_counter_ns()
+        for _ in range(number):
+            func()
+        if time.perf_counter_ns() - start >= min_time_ns:
+            break
+        number *= 2
+
+    samples = np.empty(repeat)
+    for i in range(repeat):
+        start = time.perf_counter_ns()
+        for _ in range(number):
+            func()
+        samples[i] = (time.perf_counter_ns() - start) / number
+
+    q1, median, q3 = np.percentile(samples, [25, 50, 75])
+
+    return {
+        "min_ns": float(samples.min()),
+        "median_ns": float(median),
+        "iqr_ns": float(q3 - q1),
+        "repeat": repeat,
+        "number": number,
+    }
+
+
+def bench_solvers(methods: list[str], error: float, repeat: int) -> list[dict]:
+
+    results = []
+    for method in methods:
+        for p in PROBLEMS:
+            row = {"group": "solver", "method": method, "problem": p["name"]}
+
+            try:
+                solver = SOLVERS[method](p, error)
+                # Divergent runs are reported through their status instead.
+                with np.errstate(all="ignore"):
+                    result = solver.run()
+                    row.update(measure(solver.run, repeat))
+            except Exception as e:
+                row["status"] = f"{type(e).__name__}: {e}"
+                results.append(row)
+                continue
+
+            row.update({
+                "tolerance": solver.error,
+                "status": result.status.value,
+                "iterations": result.iterations,
+                "nfev": result.nfev,
+                "abs_error": float(np.abs(result.root - p["sol"])),
+            })
+            results.append(row)
+
+    return results
+
+
+def bench_horner(repeat: int) -> list[dict]:
+
+    results = []
+    for p in POLYNOMIALS:
+        horner = Horner(p["poly"], len(p["poly"]), p["a"], p["b"], 0.002)
+
+        grid = np.linspace(p["a"], p["b"], 1_000_000)
+        out = np.empty_like(grid)
+        row = {"group": "horner", "method": "horner_eval[1e6]", "problem": p["name"]}
+        row.update(measure(lambda: horner_eval(p["poly"], grid, out), repeat))
+        results.append(row)
+
+        for method in ("bracket", "deflation", "companion", "aberth"):
+            roots = horner.roots(method)
+            row = {"group": "horner", "method": f"roots[{method}]", "problem": p["name"], "roots": len(roots)}
+            row.update(measure(lambda: horner.roots(method), repeat))
+            row["status"] = check_roots(roots, p["poly"], p["a"], p["b"])
+            results.append(row)
+
+    return results
+
+
+def check_roots(roots: np.ndarray, poly: list[float], a: float, b: float, tol: float = 1e-4) -> str:
+    """Compare the real roots in [a, b] with those of `numpy.roots`.
+
+        A root of multiplicity m is only determined to about eps^(1/m), so
+        `numpy.roots` returns it as a cluster that is merged into one root
+        here, and `tol` is loose enough for roots of multiplicity three.
+
+    """
+    ref = np.roots(poly)
+    ref = np.sort(ref[(np.abs(ref.imag) <= tol) & (ref.real >= a - tol) & (ref.real <= b + tol)].real)
+    if len(ref) > 1:
+        ref = ref[np.concatenate(([True], np.diff(ref) > tol))]
+
+    if len(roots) != len(ref):
+        return f"found {len(roots)} of {len(ref)} roots"
+
+    worst = np.abs(np.sort(roots) - ref).max(initial=0.0)
+    return "ok" if worst <= tol else f"off by {worst:.1e}"
+
+
+def run(methods: Optional[list[str]] = None, error: float = 1e-12, repeat: int = 30, horner: bool = True) -> dict:
+    """Run the suite and return a JSON-serialisable report."""
+    if methods is None:
+        methods = list(SOLVERS)
+
+    results = bench_solvers(methods, error, repeat)
+    if horner:
+        results += bench_horner(repeat)
+
+    return {
+        "created": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "python": sys.version.split()[0],
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "error": error,
+        "results": results,
+    }
+
+
+def format_report(report: dict) -> str:
+
+    lines = [f"{'method':<33}{'problem':<16}{'median':>12}{'iqr':>10}{'min':>12}{'iter':>6}{'nfev':>6}  status"]
+    for row in report["results"]:
+        if "median_ns" in row:
+            timing = f"{row['median_ns']/1e3:>10.2f}us{row['iqr_ns']/1e3:>8.2f}us{row['min_ns']/1e3:>10.2f}us"
+        else:
+            timing = f"{'-':>12}{'-':>10}{'-':>12}"
+        lines.append(
+            f"{row['method']:<33}{row['problem']:<16}{timing}"
+            f"{row.get('iterations', '-'):>6}{row.get('nfev', '-'):>6}  {row.get('status', '')}"
+        )
+
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description="Benchmark the root finding classes.")
+    parser.add_argument("--methods", nargs="+", choices=list(SOLVERS), default=list(SOLVERS))
+    parser.add_argument("--error", type=float, default=1e-12)
+    parser.add_argument("--repeat", type=int, default=30)
+    parser.add_argument("--no-horner", action="store_true")
+    parser.add_argument("--out", default=None, help="write the JSON report to this file")
+    args = parser.parse_args()
+
+    report = run(args.methods, args.error, args.repeat, not args.no_horner)
+    print(format_report(report))
+
+    if args.out is not None:
+        with open(args.out, "w") as fh:
+            json.dump(report, fh, indent=2)
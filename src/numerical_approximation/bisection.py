@@ -1,13 +1,22 @@
 import numpy as np
-import matplotlib.pyplot as plt
-from typing import Optional, Union
+from typing import TYPE_CHECKING, Iterator, Optional, Union
+
+from .history import History
+from .root_finder import Evaluate, RootFinder
+from .plotting import plot_history
+
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+    from matplotlib.figure import Figure
 
 """
 @author Jeremy Hopkins
 @author Iris Yang
-@version 0.2.2
+@version 0.3.1
 """
-class Bisection():
+class Bisection(RootFinder):
+
+    __slots__ = ("a", "b")
 
     def __init__(
         self, 
@@ -17,7 +26,9 @@ class Bisection():
         error: Optional[Union[int, float]] = None,
         string_func: Optional[str] = None,
         func_solution: Optional[float] = None,
-        txt_pos: Optional[str] = 'bottom right'
+        txt_pos: Optional[str] = 'bottom right',
+        max_iter: Optional[int] = None,
+        history: Union[str, int] = 'full'
     ):
         """Construct `Bisection`
         
@@ -29,12 +40,16 @@ class Bisection():
                 string_func: String representation of function being estimated.
                 func_sol: The true soltion to the function.
                 txt_pos: Positioning for txt plotting.
+                max_iter: Maximum number of approximations.
+                history: 'full' to keep every approximation, an int k to keep
+                    the last k, or 'off'.
 
         """
         self.error = error
         self.count = 0
-        self.approx_vals = []
+        self.nfev = 0
         self.solution = 0
+        self.result = None
 
         assert callable(f), "f must be callable"
 
@@ -63,57 +78,156 @@ class Bisection():
         assert isinstance(txt_pos, str), "txt_pos must be a string"
         self.txt_pos = txt_pos
 
+        if max_iter is None:
+            max_iter = 1000
 
-    def solve(self) -> float:
+        assert isinstance(max_iter, int) and max_iter > 0, "max_iter must be a positive int"
+        self.max_iter = max_iter
 
-        self.count = 0
-        self.approx_vals = []
+        self.history = History(history)
 
-        self.solution = self.method(self.f, self.a, self.b)
 
-        return self.solution
+    def _iterations(self) -> Iterator[Union[Evaluate, tuple[float, float, tuple[float, float]]]]:
+        return self.method(self.a, self.b)
 
         
-    def method(self, f, a, b):
+    def method(self, a, b) -> Iterator[Union[Evaluate, tuple[float, float, tuple[float, float]]]]:
 
-        self.count += 1
+        fa, fb = yield Evaluate(a, b)
 
-        if np.sign(f(a)) == np.sign(f(b)):
+        if np.sign(fa) == np.sign(fb):
             raise Exception(
             "The scalars a and b do not bound a root")
 
-        m = (a + b)/2
-        self.approx_vals.append(m)
-
-        if np.abs(f(m)) < self.error:
-            return m
-        elif np.sign(f(m)) == np.sign(f(a)):
-            return self.method(f, m, b)
-        elif np.sign(f(m)) == np.sign(f(b)):
-            return self.method(f, a, m)
-
-
-    def plot_solution(self) -> tuple[plt.Figure, plt.Axes]:
-        fig, ax = plt.subplots()
-        fig.set_size_inches(11, 8.5)
-        if self.string_func is not None:
-            ax.set_title("Bisection Method for " + self.string_func)
-        else:
-            ax.set_title("Bisection Method")
-        ax.set_xlabel("Number of Computations")
-        ax.set_ylabel("Approximation")
-        if self.txt_pos == 'bottom right':
-            ax.text(0.9675, 0.065, f'Target Solution: {self.func_solution:.1f}', ha='right', va='bottom', transform=ax.transAxes)
-        if self.txt_pos == 'bottom left':
-            ax.text(0.25, 0.065, f'Target Solution: {self.func_solution:.1f}', ha='right', va='bottom', transform=ax.transAxes)
-        if self.txt_pos == 'top left':
-            ax.text(0.25, 0.935, f'Target Solution: {self.func_solution:.1f}', ha='right', va='bottom', transform=ax.transAxes)
-        if self.txt_pos == 'top right':
-            ax.text(0.9675, 0.935, f'Target Solution: {self.func_solution:.1f}', ha='right', va='bottom', transform=ax.transAxes)
-        ax.plot(range(len(self.approx_vals)), self.approx_vals, label='Approximation')
-        ax.scatter(range(len(self.approx_vals)), self.approx_vals, s=5)
-        if self.func_solution is not None:
-            ax.axhline(y=self.solution, color='lightgreen', linestyle='-', label='Solution')
-        ax.legend()
-        
-        return fig, ax
+        while True:
+            m = (a + b)/2
+            # a and b are adjacent floats, the bracket cannot be halved any
+            # further and f is not below the error anywhere in it.
+            if m == a or m == b:
+                return
+
+            fm, = yield Evaluate(m)
+
+            if np.sign(fm) == np.sign(fa):
+                a, fa = m, fm
+            elif np.sign(fm) == np.sign(fb):
+                b, fb = m, fm
+            else:
+                yield m, fm, (a, b)
+                return
+
+            yield m, fm, (a, b)
+
+
+    def plot_solution(self, ax: Optional["Axes"] = None) -> tuple["Figure", "Axes"]:
+        return plot_history(self, "Bisection Method", "Number of Computations", self.solution, ax)
+
+
+class BatchBisection():
+
+    __slots__ = ("f", "a", "b", "args", "error", "max_iter", "count", "nfev", "converged", "solution")
+
+    def __init__(
+        self,
+        f: callable,
+        a: np.ndarray,
+        b: np.ndarray,
+        error: Optional[Union[int, float]] = None,
+        max_iter: Optional[int] = None,
+        args: tuple = ()
+    ):
+        """Construct `BatchBisection`
+
+            Solves many independent brackets at once. `f` is called once per
+            iteration on the midpoints of every bracket that has not yet
+            converged, so it must accept and return NumPy arrays. Per-bracket
+            parameters can be passed through `args`; they are masked together
+            with the brackets so `f` always receives matching lanes. Brackets
+            whose ends have the same sign are not solved, their root is NaN,
+            their count 0 and they are reported as not converged.
+
+            Args:
+                f: Vectorized callable representation of function to be estimated.
+                a: Array of min point values.
+                b: Array of max point values.
+                error: Error bounds.
+                max_iter: Maximum number of halvings per bracket.
+                args: Extra arrays passed to `f`, broadcast against `a` and `b`.
+
+        """
+        self.count = None
+        self.nfev = None
+        self.converged = None
+        self.solution = None
+
+        assert callable(f), "f must be callable"
+        self.f = f
+
+        a, b, *args = np.broadcast_arrays(
+            np.asarray(a, dtype=float), np.asarray(b, dtype=float), *args)
+        self.a = a
+        self.b = b
+        self.args = tuple(np.ravel(arg) for arg in args)
+
+        if error is None:
+            error = 0.01
+
+        assert isinstance(error, (int, float)), "error must be int or float type"
+        self.error = error
+
+        if max_iter is None:
+            max_iter = 1100
+
+        assert isinstance(max_iter, int) and max_iter > 0, "max_iter must be a positive int"
+        self.max_iter = max_iter
+
+
+    def solve(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+
+        a = self.a.ravel().copy()
+        b = self.b.ravel().copy()
+        fa = np.asarray(self.f(a, *self.args), dtype=float)
+        fb = np.asarray(self.f(b, *self.args), dtype=float)
+
+        # Lanes that do not bound a root are left out and reported as not
+        # converged with a NaN root, the others are solved as usual.
+        bounded = np.sign(fa) != np.sign(fb)
+
+        roots = np.where(bounded, (a + b)/2, np.nan)
+        count = np.zeros(a.size, dtype=int)
+        converged = np.zeros(a.size, dtype=bool)
+        active = np.flatnonzero(bounded)
+
+        for _ in range(self.max_iter):
+            if active.size == 0:
+                break
+
+            a_act = a[active]
+            b_act = b[active]
+            fa_act = fa[active]
+
+            m = (a_act + b_act)/2
+            fm = np.asarray(self.f(m, *(arg[active] for arg in self.args)), dtype=float)
+
+            roots[active] = m
+            count[active] += 1
+
+            left = np.sign(fm) == np.sign(fa_act)
+            a[active] = np.where(left, m, a_act)
+            fa[active] = np.where(left, fm, fa_act)
+            b[active] = np.where(left, b_act, m)
+
+            # Lanes whose bracket can no longer be halved in floating point
+            # are dropped as well, they are reported as not converged.
+            stuck = (m == a_act) | (m == b_act)
+            done = np.abs(fm) < self.error
+            converged[active[done]] = True
+            active = active[~(done | stuck)]
+
+        shape = self.a.shape
+        self.solution = roots.reshape(shape)
+        self.count = count.reshape(shape)
+        self.nfev = self.count + 2
+        self.converged = converged.reshape(shape)
+
+        return self.solution, self.count, self.converged
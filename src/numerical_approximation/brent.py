@@ -0,0 +1,187 @@
+import numpy as np
+from typing import TYPE_CHECKING, Iterator, Optional, Union
+
+from .history import History
+from .root_finder import Evaluate, RootFinder, Status
+from .plotting import plot_history
+
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+    from matplotlib.figure import Figure
+
+"""
+@author Jeremy Hopkins
+@author Iris Yang
+@version 0.2.1
+"""
+class Brent(RootFinder):
+
+    __slots__ = ("a", "b", "xtol")
+
+    def __init__(
+        self,
+        f: callable,
+        a: Union[int, float],
+        b: Union[int, float],
+        error: Optional[Union[int, float]] = None,
+        string_func: Optional[str] = None,
+        func_solution: Optional[float] = None,
+        txt_pos: Optional[str] = 'bottom right',
+        max_iter: Optional[int] = None,
+        history: Union[str, int] = 'full',
+        xtol: Optional[Union[int, float]] = None
+    ):
+        """Construct `Brent`
+
+            Safeguarded hybrid of the bracketing and open methods. Each step
+            tries inverse quadratic interpolation, or a secant step when only
+            two points are distinct, and falls back to bisection when the step
+            would leave the bracket or does not shrink it fast enough. The
+            bracket always contains a root, so the method converges in at most
+            about the square of the number of bisection steps.
+
+            Args:
+                f: Callable representation of function to be estimated.
+                a: Min point value.
+                b: Max point value
+                error: Error bounds.
+                string_func: String representation of function being estimated.
+                func_sol: The true soltion to the function.
+                txt_pos: Positioning for txt plotting.
+                max_iter: Maximum number of approximations.
+                history: 'full' to keep every approximation, an int k to keep
+                    the last k, or 'off'.
+                xtol: Bracket width at which to stop even if |f(x)| >= error.
+
+        """
+
+        self.count = 0
+        self.nfev = 0
+        self.solution = 0
+        self.result = None
+
+        assert callable(f), "f must be callable"
+        self.f = f
+
+        assert isinstance(a, (int, float)), "a must be int or float"
+        self.a = a
+
+        assert isinstance(b, (int, float)), "b must be int or float"
+        self.b = b
+
+        if error is None:
+            error = 0.01
+
+        assert isinstance(error, (int, float)), "error must be int or float type"
+        self.error = error
+
+        if string_func is not None:
+            assert isinstance(string_func, str), "string_func must be string representation of function"
+        self.string_func = string_func
+
+        if func_solution is not None:
+            assert isinstance(func_solution, float), "func_solution must be float"
+        self.func_solution = func_solution
+
+        assert isinstance(txt_pos, str), "txt_pos must be a string"
+        self.txt_pos = txt_pos
+
+        if max_iter is None:
+            max_iter = 1000
+
+        assert isinstance(max_iter, int) and max_iter > 0, "max_iter must be a positive int"
+        self.max_iter = max_iter
+
+        self.history = History(history)
+
+        if xtol is None:
+            xtol = 0.0
+
+        assert isinstance(xtol, (int, float)) and xtol >= 0, "xtol must be a non-negative int or float"
+        self.xtol = xtol
+
+
+    def _iterations(self) -> Iterator[Union[Evaluate, tuple[float, float, tuple[float, float]]]]:
+        return self.method(self.a, self.b)
+
+
+    def method(self, a, b) -> Iterator[Union[Evaluate, tuple[float, float, tuple[float, float]]]]:
+
+        eps = np.finfo(float).eps
+
+        fa, fb = yield Evaluate(a, b)
+
+        if np.sign(fa) == np.sign(fb) and fb != 0:
+            raise Exception(
+            "The scalars a and b do not bound a root")
+
+        # b is the best approximation so far, c the other end of the bracket
+        # and a the previous value of b.
+        if np.abs(fa) < np.abs(fb):
+            a, b, fa, fb = b, a, fb, fa
+        c, fc = a, fa
+        d = e = b - a
+
+        yield b, fb, _bracket(b, c)
+
+        while True:
+            if np.sign(fb) == np.sign(fc):
+                c, fc = a, fa
+                d = e = b - a
+            if np.abs(fc) < np.abs(fb):
+                a, b, c = b, c, b
+                fa, fb, fc = fb, fc, fb
+
+            tol = 2 * eps * np.abs(b) + 0.5 * self.xtol
+            m = 0.5 * (c - b)
+
+            if np.abs(m) <= tol or fb == 0:
+                return Status.CONVERGED
+
+            if np.abs(e) < tol or np.abs(fa) <= np.abs(fb):
+                d = e = m
+            else:
+                s = fb/fa
+                if a == c:
+                    p = 2 * m * s
+                    q = 1 - s
+                else:
+                    q = fa/fc
+                    r = fb/fc
+                    p = s * (2 * m * q * (q - r) - (b - a) * (r - 1))
+                    q = (q - 1) * (r - 1) * (s - 1)
+
+                if p > 0:
+                    q = -q
+                else:
+                    p = -p
+
+                # Accept the interpolation only if it stays well inside the
+                # bracket and shrinks faster than the step before last.
+                if 2 * p < min(3 * m * q - np.abs(tol * q), np.abs(e * q)):
+                    e = d
+                    d = p/q
+                else:
+                    d = e = m
+
+            a, fa = b, fb
+            b = b + d if np.abs(d) > tol else b + np.copysign(tol, m)
+            fb, = yield Evaluate(b)
+
+            # c is only replaced at the top of the loop, by the previous b
+            # when f(b) has the sign of f(c), and then swapped with b when it
+            # is the better end. The end that will be b is reported here, so
+            # every approximation follows a fresh evaluation.
+            x, fx = (c, fc) if np.sign(fb) != np.sign(fc) else (a, fa)
+            if np.abs(fx) < np.abs(fb):
+                yield x, fx, _bracket(b, x)
+            else:
+                yield b, fb, _bracket(b, x)
+
+
+    def plot_solution(self, ax: Optional["Axes"] = None) -> tuple["Figure", "Axes"]:
+        return plot_history(self, "Brent Method", "Number of Computations", self.solution, ax)
+
+
+def _bracket(x: float, y: float) -> tuple[float, float]:
+    return (x, y) if x <= y else (y, x)
@@ -0,0 +1,134 @@
+import inspect
+import threading
+import numpy as np
+from collections import OrderedDict
+from typing import NamedTuple, Optional
+
+from .dual import Dual
+
+"""
+@author Jeremy Hopkins
+@author Iris Yang
+@version 0.1.0
+"""
+class CacheInfo(NamedTuple):
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class EvalCache():
+    """Memoizing, thread-safe wrapper around an expensive function.
+
+        Pass an `EvalCache` wherever a solver expects `f` and share it between
+        solvers to reuse evaluations across methods and runs. Results are keyed
+        on the exact float input and evicted least recently used first once
+        `maxsize` entries are stored. Dual numbers with float parts are keyed on
+        both parts, so Newton's derivative evaluations are cached too. Any
+        other input, such as an array, is passed straight through to `f`.
+
+        When `f` is a coroutine function the cache is one too, calling it
+        returns a coroutine whose awaited value is what gets stored, so it
+        can be passed to `arun` and `run_all` like `f` itself.
+
+    """
+
+    __slots__ = ("f", "maxsize", "hits", "misses", "_values", "_lock", "_async")
+
+    def __init__(self, f: callable, maxsize: Optional[int] = None):
+
+        assert callable(f), "f must be callable"
+        self.f = f
+
+        if maxsize is None:
+            maxsize = 4096
+
+        assert isinstance(maxsize, int) and maxsize > 0, "maxsize must be a positive int"
+        self.maxsize = maxsize
+
+        self.hits = 0
+        self.misses = 0
+        self._values = OrderedDict()
+        self._lock = threading.Lock()
+        self._async = inspect.iscoroutinefunction(f)
+
+
+    def __call__(self, x):
+
+        if self._async:
+            return self._acall(x)
+
+        key = _key(x)
+        if key is None:
+            return self.f(x)
+
+        found, value = self._lookup(key)
+        if found:
+            return value
+
+        # f runs outside the lock so slow evaluations do not serialize threads.
+        value = self.f(x)
+        if inspect.isawaitable(value):
+            if inspect.iscoroutine(value):
+                value.close()
+            raise TypeError("f returned an awaitable, pass an async def function so EvalCache can await it")
+
+        self._store(key, value)
+        return value
+
+
+    async def _acall(self, x):
+
+        key = _key(x)
+        if key is None:
+            return await self.f(x)
+
+        found, value = self._lookup(key)
+        if found:
+            return value
+
+        value = await self.f(x)
+        self._store(key, value)
+        return value
+
+
+    def _lookup(self, key) -> tuple:
+        with self._lock:
+            if key in self._values:
+                self._values.move_to_end(key)
+                self.hits += 1
+                return True, self._values[key]
+        return False, None
+
+
+    def _store(self, key, value) -> None:
+        with self._lock:
+            self.misses += 1
+            self._values[key] = value
+            self._values.move_to_end(key)
+            if len(self._values) > self.maxsize:
+                self._values.popitem(last=False)
+
+
+    def cache_info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._values))
+
+
+    def cache_clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+def _key(x):
+
+    if isinstance(x, (float, int, np.floating, np.integer)) and not isinstance(x, bool):
+        return float(x)
+    if isinstance(x, Dual) and _key(x.val) is not None and _key(x.der) is not None:
+        return (float(x.val), float(x.der))
+
+    return None
@@ -0,0 +1,266 @@
+import warnings
+import numpy as np
+from typing import Optional, Union
+
+"""
+@author Jeremy Hopkins
+@author Iris Yang
+@version 0.1.0
+"""
+class Chebyshev():
+    """Chebyshev proxy for finding every root of a smooth f on [a, b].
+
+        f is sampled at the Chebyshev points cos(pi j/n) mapped to [a, b],
+        starting with n = 16 and doubling n until the trailing Chebyshev
+        coefficients have decayed below `error` relative to the largest.
+        The points for 2n contain those for n, so every doubling only
+        evaluates f at the n new points, in one call when f accepts
+        arrays. The roots of the interpolant are the real eigenvalues of
+        its colleague matrix; above degree 50 the interval is split and
+        the interpolant, not f, is resampled on each half, which keeps the
+        eigenproblems small. Each root is then polished with `polish`
+        Newton steps on the true f, using the derivative of the
+        interpolant.
+
+        A smooth f needs a few dozen to a few hundred evaluations for all of
+        its roots, against tens per root for the bracketing methods, so the
+        proxy pays off when f is expensive. Functions that are not smooth
+        on [a, b], such as abs(x) - 0.5 or a jump, never resolve: `fit`
+        stops at `max_degree`, sets `converged` to False and warns, and the
+        roots are then only as good as the unresolved interpolant, 2e-6
+        off for abs(x) - 0.5 on [-1, 1]. Bracket such roots with
+        `find_roots` and a bracketing method instead.
+
+    """
+
+    __slots__ = ("f", "a", "b", "error", "max_degree", "polish", "coeffs", "nfev", "converged")
+
+    def __init__(
+        self,
+        f: callable,
+        a: Union[int, float],
+        b: Union[int, float],
+        error: Optional[float] = None,
+        max_degree: Optional[int] = None,
+        polish: Optional[int] = None
+    ):
+        """Construct `Chebyshev`
+
+            Args:
+                f: Callable representation of function to be estimated.
+                a: Min point value.
+                b: Max point value.
+                error: Relative size of the trailing coefficients at which
+                    the interpolant counts as resolved.
+                max_degree: Largest degree of the interpolant, a power of 2.
+                polish: Number of Newton steps on f per root, 0 to keep the
+                    roots of the interpolant.
+
+        """
+        self.coeffs = None
+        self.nfev = 0
+        self.converged = None
+
+        assert callable(f), "f must be callable"
+        self.f = f
+
+        assert isinstance(a, (int, float)) and isinstance(b, (int, float)) and a < b, "a and b must be numbers with a < b"
+        self.a = a
+        self.b = b
+
+        if error is None:
+            error = 1e-13
+
+        assert isinstance(error, float) and error > 0, "error must be a positive float"
+        self.error = error
+
+        if max_degree is None:
+            max_degree = 1024
+
+        assert isinstance(max_degree, int) and max_degree >= 16 and max_degree & (max_degree - 1) == 0, \
+            "max_degree must be a power of 2 of at least 16"
+        self.max_degree = max_degree
+
+        if polish is None:
+            polish = 1
+
+        assert isinstance(polish, int) and polish >= 0, "polish must be a non-negative int"
+        self.polish = polish
+
+
+    def fit(self) -> np.ndarray:
+        """Sample f until its interpolant is resolved and return the Chebyshev coefficients."""
+        self.nfev = 0
+        n = 16
+        v = self._sample(np.cos(np.pi * np.arange(n + 1) / n))
+
+        while True:
+            c = _coefficients(v)
+            scale = np.abs(c).max()
+            self.converged = np.abs(c[-max(3, n // 8):]).max() <= self.error * scale
+            if self.converged or 2 * n > self.max_degree:
+                break
+
+            # The points of the doubled grid with odd index are the new ones.
+            fresh = self._sample(np.cos(np.pi * np.arange(1, 2 * n, 2) / (2 * n)))
+            w = np.empty(2 * n + 1)
+            w[0::2] = v
+            w[1::2] = fresh
+            v, n = w, 2 * n
+
+        if not self.converged:
+            warnings.warn(
+                f"f is not resolved by a Chebyshev interpolant of degree {n}, its roots may be inaccurate",
+                RuntimeWarning, stacklevel=2)
+
+        self.coeffs = _chop(c, self.error * scale)
+        return self.coeffs
+
+
+    def evaluate(self, x: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+        """Evaluate the interpolant at points of [a, b]."""
+        if self.coeffs is None:
+            self.fit()
+        return _clenshaw(self.coeffs, self._to_unit(np.asarray(x, dtype=float)))
+
+
+    def roots(self) -> np.ndarray:
+        """Return every root of f in [a, b] found through the interpolant, sorted."""
+        if self.coeffs is None:
+            self.fit()
+
+        c = self.coeffs
+        if len(c) < 2:
+            return np.empty(0)
+
+        scale = np.abs(c).max()
+        x = self._from_unit(_unit_roots(c, self.error * scale))
+
+        if self.polish and len(x):
+            dc = _derivative(c) * 2 / (self.b - self.a)
+            # A proxy root is within about a grid spacing of the true root,
+            # larger Newton steps come from a nearly flat f and are refused.
+            limit = (self.b - self.a) / len(c)**2
+            for _ in range(self.polish):
+                fx = self._sample_at(x)
+                dp = _clenshaw(dc, self._to_unit(x))
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    step = fx / dp
+                ok = np.isfinite(step) & (np.abs(step) <= limit)
+                x = np.where(ok, np.clip(x - step, self.a, self.b), x)
+
+        x = np.sort(x)
+        if len(x) > 1:
+            keep = np.diff(x) > np.sqrt(np.finfo(float).eps) * (self.b - self.a)
+            x = x[np.concatenate(([True], keep))]
+
+        return x
+
+
+    def _sample(self, t: np.ndarray) -> np.ndarray:
+        return self._sample_at(self._from_unit(t))
+
+
+    def _sample_at(self, x: np.ndarray) -> np.ndarray:
+
+        self.nfev += len(x)
+        try:
+            y = np.asarray(self.f(x), dtype=float)
+            if y.shape == x.shape:
+                return y
+        except (TypeError, ValueError):
+            pass
+
+        return np.array([self.f(xi) for xi in x], dtype=float)
+
+
+    def _from_unit(self, t: np.ndarray) -> np.ndarray:
+        return (self.a + self.b) / 2 + (self.b - self.a) / 2 * t
+
+
+    def _to_unit(self, x: np.ndarray) -> np.ndarray:
+        return (2 * x - self.a - self.b) / (self.b - self.a)
+
+
+def chebyshev_roots(f: callable, a: Union[int, float], b: Union[int, float], error: Optional[float] = None) -> np.ndarray:
+    """Return every root of a smooth f in [a, b], see `Chebyshev`."""
+    return Chebyshev(f, a, b, error).roots()
+
+
+def _coefficients(v: np.ndarray) -> np.ndarray:
+
+    # Values at cos(pi j/n), j = 0..n, to coefficients of T_0..T_n, a DCT-I
+    # done as the FFT of the even extension.
+    n = len(v) - 1
+    c = np.fft.rfft(np.concatenate((v, v[n - 1:0:-1]))).real / n
+    c[0] /= 2
+    c[n] /= 2
+
+    return c
+
+
+def _chop(c: np.ndarray, tol: float) -> np.ndarray:
+
+    big = np.flatnonzero(np.abs(c) > tol)
+    return c[:big[-1] + 1] if len(big) else c[:1]
+
+
+def _clenshaw(c: np.ndarray, t: np.ndarray) -> np.ndarray:
+
+    b1 = np.zeros_like(t)
+    b2 = np.zeros_like(t)
+    for ck in c[:0:-1]:
+        b1, b2 = 2 * t * b1 - b2 + ck, b1
+
+    return t * b1 - b2 + c[0]
+
+
+def _derivative(c: np.ndarray) -> np.ndarray:
+
+    n = len(c) - 1
+    if n == 0:
+        return np.zeros(1)
+
+    # d_{k-1} = d_{k+1} + 2k c_k from the top down, with d_n = d_{n+1} = 0.
+    d = np.zeros(n + 2)
+    for k in range(n, 0, -1):
+        d[k - 1] = d[k + 1] + 2 * k * c[k]
+    d[0] /= 2
+
+    return d[:n]
+
+
+def _unit_roots(c: np.ndarray, tol: float, depth: int = 0) -> np.ndarray:
+
+    c = _chop(c, tol)
+    n = len(c) - 1
+    if n < 1:
+        return np.empty(0)
+
+    if n > 50 and depth < 20:
+        # Split slightly off center, as a root exactly at the split point
+        # would otherwise be found in both halves.
+        s = -0.004849834917525
+        t = np.cos(np.pi * np.arange(n + 1) / n)
+        left = _unit_roots(_coefficients(_clenshaw(c, (s - 1) / 2 + (s + 1) / 2 * t)), tol, depth + 1)
+        right = _unit_roots(_coefficients(_clenshaw(c, (1 + s) / 2 + (1 - s) / 2 * t)), tol, depth + 1)
+        return np.concatenate(((s - 1) / 2 + (s + 1) / 2 * left, (1 + s) / 2 + (1 - s) / 2 * right))
+
+    # Colleague matrix, the Chebyshev analogue of the companion matrix.
+    M = np.zeros((n, n))
+    if n > 1:
+        k = np.arange(n - 1)
+        M[k, k + 1] = 0.5
+        M[k + 1, k] = 0.5
+        M[0, 1] = 1.0
+    M[-1] -= c[:n] / (2 * c[n])
+    if n == 1:
+        M[0, 0] = -c[0] / c[1]
+
+    # A double root splits into a complex pair about sqrt(eps) apart, so
+    # eigenvalues are accepted as real well above that.
+    z = np.linalg.eigvals(M)
+    slack = 1e-6
+    z = z[(np.abs(z.imag) <= slack) & (np.abs(z.real) <= 1 + slack)].real
+
+    return np.clip(z, -1.0, 1.0)
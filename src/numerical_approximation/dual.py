@@ -0,0 +1,219 @@
+import numpy as np
+from typing import Union
+
+"""
+@author Jeremy Hopkins
+@author Iris Yang
+@version 0.2.0
+"""
+class Dual():
+    """Dual number `val + der*e` with `e**2 = 0` for forward mode differentiation.
+
+        Evaluating `f(Dual(x, 1.0))` returns `Dual(f(x), f'(x))` as long as `f`
+        is built from arithmetic operators and the NumPy ufuncs listed in
+        `_UFUNCS`. Both parts may be NumPy arrays, in which case every lane
+        is differentiated independently.
+
+    """
+
+    __slots__ = ("val", "der")
+
+    def __init__(self, val, der=0.0):
+        self.val = val
+        self.der = der
+
+
+    def __repr__(self) -> str:
+        return f"Dual({self.val!r}, {self.der!r})"
+
+
+    def __add__(self, other):
+        other = _lift(other)
+        return Dual(self.val + other.val, self.der + other.der)
+
+    __radd__ = __add__
+
+
+    def __sub__(self, other):
+        other = _lift(other)
+        return Dual(self.val - other.val, self.der - other.der)
+
+
+    def __rsub__(self, other):
+        return _lift(other) - self
+
+
+    def __mul__(self, other):
+        other = _lift(other)
+        return Dual(self.val * other.val, self.der * other.val + self.val * other.der)
+
+    __rmul__ = __mul__
+
+
+    def __truediv__(self, other):
+        other = _lift(other)
+        return Dual(self.val / other.val, (self.der * other.val - self.val * other.der) / (other.val * other.val))
+
+
+    def __rtruediv__(self, other):
+        return _lift(other) / self
+
+
+    def __pow__(self, other):
+        if isinstance(other, Dual):
+            return (other * self.log()).exp()
+        if np.all(other == 0):
+            return Dual(self.val ** 0, self.der * 0)
+        return Dual(self.val ** other, other * self.val ** (other - 1) * self.der)
+
+
+    def __rpow__(self, other):
+        val = other ** self.val
+        return Dual(val, val * np.log(other) * self.der)
+
+
+    def __neg__(self):
+        return Dual(-self.val, -self.der)
+
+
+    def __pos__(self):
+        return self
+
+
+    def __abs__(self):
+        return Dual(np.abs(self.val), np.sign(self.val) * self.der)
+
+
+    def __lt__(self, other):
+        return self.val < _lift(other).val
+
+
+    def __le__(self, other):
+        return self.val <= _lift(other).val
+
+
+    def __gt__(self, other):
+        return self.val > _lift(other).val
+
+
+    def __ge__(self, other):
+        return self.val >= _lift(other).val
+
+
+    def sqrt(self):
+        val = np.sqrt(self.val)
+        return Dual(val, self.der / (2 * val))
+
+
+    def exp(self):
+        val = np.exp(self.val)
+        return Dual(val, val * self.der)
+
+
+    def log(self):
+        return Dual(np.log(self.val), self.der / self.val)
+
+
+    def sin(self):
+        return Dual(np.sin(self.val), np.cos(self.val) * self.der)
+
+
+    def cos(self):
+        return Dual(np.cos(self.val), -np.sin(self.val) * self.der)
+
+
+    def tan(self):
+        val = np.tan(self.val)
+        return Dual(val, (1 + val * val) * self.der)
+
+
+    def arctan(self):
+        return Dual(np.arctan(self.val), self.der / (1 + self.val * self.val))
+
+
+    def sinh(self):
+        return Dual(np.sinh(self.val), np.cosh(self.val) * self.der)
+
+
+    def cosh(self):
+        return Dual(np.cosh(self.val), np.sinh(self.val) * self.der)
+
+
+    def tanh(self):
+        val = np.tanh(self.val)
+        return Dual(val, (1 - val * val) * self.der)
+
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        op = _UFUNCS.get(ufunc)
+        if method != "__call__" or kwargs or op is None:
+            return NotImplemented
+        return op(*(_lift(x) for x in inputs))
+
+
+def _lift(x) -> Dual:
+    return x if isinstance(x, Dual) else Dual(x, 0.0)
+
+
+_UFUNCS = {
+    np.add: Dual.__add__,
+    np.subtract: Dual.__sub__,
+    np.multiply: Dual.__mul__,
+    np.true_divide: Dual.__truediv__,
+    np.power: Dual.__pow__,
+    np.negative: Dual.__neg__,
+    np.positive: Dual.__pos__,
+    np.absolute: Dual.__abs__,
+    np.square: lambda x: x * x,
+    np.sqrt: Dual.sqrt,
+    np.exp: Dual.exp,
+    np.log: Dual.log,
+    np.sin: Dual.sin,
+    np.cos: Dual.cos,
+    np.tan: Dual.tan,
+    np.arctan: Dual.arctan,
+    np.sinh: Dual.sinh,
+    np.cosh: Dual.cosh,
+    np.tanh: Dual.tanh,
+}
+
+
+def dual_derivative(f: callable, x: Union[int, float, np.ndarray]) -> tuple:
+    """Return `(f(x), f'(x))` from a single evaluation of `f` on a dual number.
+
+        Raises `TypeError` when `f` does not propagate dual numbers, for example
+        when it calls into `math` or converts its argument to float.
+
+    """
+    return dual_parts(f(Dual(x, np.ones_like(x, dtype=float) if isinstance(x, np.ndarray) else 1.0)))
+
+
+def dual_parts(y) -> tuple:
+    """Return `(f(x), f'(x))` from the value `y` of f at `Dual(x, 1)`.
+
+        Raises `TypeError` when f did not propagate the dual number.
+
+    """
+    if isinstance(y, Dual):
+        return y.val, y.der
+    if isinstance(y, np.ndarray) and y.dtype == object:
+        raise TypeError("f does not propagate dual numbers")
+
+    return y, y * 0.0
+
+
+def fd_derivative(f: callable, x: Union[int, float, np.ndarray]) -> Union[float, np.ndarray]:
+    """Return a central difference estimate of `f'(x)`.
+
+        The step is scaled with `x` and set to the cube root of machine
+        epsilon, which balances truncation against rounding error for a
+        central difference.
+
+    """
+    h = fd_step(x)
+    return (f(x + h) - f(x - h)) / (2 * h)
+
+
+def fd_step(x: Union[int, float, np.ndarray]) -> Union[float, np.ndarray]:
+    """Return the central difference step used by `fd_derivative` at x."""
+    return np.cbrt(np.finfo(float).eps) * np.maximum(1.0, np.abs(x))
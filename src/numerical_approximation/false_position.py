@@ -1,13 +1,22 @@
 import numpy as np
-import matplotlib.pyplot as plt
-from typing import Optional, Union
+from typing import TYPE_CHECKING, Iterator, Optional, Union
+
+from .history import History
+from .root_finder import Evaluate, RootFinder
+from .plotting import plot_history
+
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+    from matplotlib.figure import Figure
 
 """
 @author Jeremy Hopkins
 @author Iris Yang
-@version 0.2.1
+@version 0.4.1
 """
-class FalsePosition():
+class FalsePosition(RootFinder):
+
+    __slots__ = ("a", "b", "mode")
 
     def __init__(
         self, 
@@ -17,7 +26,10 @@ class FalsePosition():
         error: Optional[Union[int, float]] = None,
         string_func: Optional[str] = None,
         func_solution: Optional[float] = None,
-        txt_pos: Optional[str] = 'bottom right'
+        txt_pos: Optional[str] = 'bottom right',
+        max_iter: Optional[int] = None,
+        history: Union[str, int] = 'full',
+        mode: str = 'plain'
     ):
         """Construct `FalsePosition`
         
@@ -29,12 +41,19 @@ class FalsePosition():
                 string_func: String representation of function being estimated.
                 func_sol: The true soltion to the function.
                 txt_pos: Positioning for txt plotting.
+                max_iter: Maximum number of approximations.
+                history: 'full' to keep every approximation, an int k to keep
+                    the last k, or 'off'.
+                mode: 'plain' regula falsi, or 'illinois', 'pegasus' or
+                    'anderson-bjorck', which scale down the function value of
+                    an endpoint retained twice in a row so it cannot stagnate.
 
         """
 
         self.count = 0
-        self.approx_vals = []
+        self.nfev = 0
         self.solution = 0
+        self.result = None
 
         assert callable(f), "f must be callable"
         self.f = f
@@ -62,62 +81,65 @@ class FalsePosition():
         assert isinstance(txt_pos, str), "txt_pos must be a string"
         self.txt_pos = txt_pos
 
-        
-    def solve(self) -> float:
-        m = (self.f(self.b) - self.f(self.a))/(self.b - self.a)
+        if max_iter is None:
+            max_iter = 1000
 
-        c = self.a - self.f(self.a)/m
+        assert isinstance(max_iter, int) and max_iter > 0, "max_iter must be a positive int"
+        self.max_iter = max_iter
 
-        self.count = 0
-        self.approx_vals = []
-        self.approx_vals.append(c)
+        self.history = History(history)
 
-        self.solution = self.method(self.f, self.a, self.b, c)
-        return self.solution
+        assert mode in ('plain', 'illinois', 'pegasus', 'anderson-bjorck'), \
+            "mode must be 'plain', 'illinois', 'pegasus' or 'anderson-bjorck'"
+        self.mode = mode
 
         
-    def method(self, f, a, b, c):
-        self.count += 1
-
-        if(np.abs(f(c)) < self.error):
-            return c
-
-        if(f(c)*f(a) > 0):
-            a = c
-        else:
-            b = c
-
-        m = (f(b) - f(a))/(b - a)
-
-        c = a - f(a)/m
-
-        self.approx_vals.append(c)
-
-        return self.method(f, a, b, c)
-
-
-    def plot_solution(self) -> tuple[plt.Figure, plt.Axes]:
-        fig, ax = plt.subplots()
-        fig.set_size_inches(11, 8.5)
-        if self.string_func is not None:
-            ax.set_title("False Position Method for " + self.string_func)
-        else:
-            ax.set_title("False Position Method")
-        ax.set_xlabel("Num Computations")
-        ax.set_ylabel("Approximation")
-        if self.txt_pos == 'bottom right':
-            ax.text(0.9675, 0.065, f'Target Solution: {self.func_solution:.1f}', ha='right', va='bottom', transform=ax.transAxes)
-        if self.txt_pos == 'bottom left':
-            ax.text(0.25, 0.065, f'Target Solution: {self.func_solution:.1f}', ha='right', va='bottom', transform=ax.transAxes)
-        if self.txt_pos == 'top left':
-            ax.text(0.25, 0.935, f'Target Solution: {self.func_solution:.1f}', ha='right', va='bottom', transform=ax.transAxes)
-        if self.txt_pos == 'top right':
-            ax.text(0.9675, 0.935, f'Target Solution: {self.func_solution:.1f}', ha='right', va='bottom', transform=ax.transAxes)
-        ax.plot(range(len(self.approx_vals)), self.approx_vals, label='Approximation')
-        ax.scatter(range(len(self.approx_vals)), self.approx_vals, s=5)
-        if self.func_solution is not None:
-            ax.axhline(y=self.solution, color='lightgreen', linestyle='-', label='Solution')
-        ax.legend()
-
-        return fig, ax
+    def _iterations(self) -> Iterator[Union[Evaluate, tuple[float, float, tuple[float, float]]]]:
+        return self.method(self.a, self.b)
+
+        
+    def method(self, a, b) -> Iterator[Union[Evaluate, tuple[float, float, tuple[float, float]]]]:
+
+        fa, fb = yield Evaluate(a, b)
+
+        # Side of the bracket replaced in the previous step, -1 for a and 1
+        # for b. The scaling factors are all positive so signs are kept.
+        side = 0
+
+        while True:
+            m = (fb - fa)/(b - a)
+
+            if m == 0:
+                return
+
+            c = a - fa/m
+            fc, = yield Evaluate(c)
+
+            if(fc*fa > 0):
+                if side == -1 and self.mode != 'plain':
+                    fb *= self._scale(fa, fc)
+                a, fa = c, fc
+                side = -1
+            else:
+                if side == 1 and self.mode != 'plain':
+                    fa *= self._scale(fb, fc)
+                b, fb = c, fc
+                side = 1
+
+            yield c, fc, (a, b)
+
+
+    def _scale(self, f_old, f_new):
+
+        if self.mode == 'illinois':
+            return 0.5
+        if self.mode == 'pegasus':
+            return f_old/(f_old + f_new)
+
+        m = 1 - f_new/f_old
+        return m if m > 0 else 0.5
+
+
+    def plot_solution(self, ax: Optional["Axes"] = None) -> tuple["Figure", "Axes"]:
+        return plot_history(self, "False Position Method", "Num Computations", self.solution, ax)
         
\ No newline at end of file
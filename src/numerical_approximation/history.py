@@ -0,0 +1,76 @@
+import numpy as np
+from typing import Union
+
+"""
+@author Jeremy Hopkins
+@author Iris Yang
+@version 0.2.0
+"""
+class History():
+    """Approximation history of a solver.
+
+        The policy is 'full' to keep every approximation in a NumPy buffer
+        whose capacity doubles when it fills up, an int k to keep only the
+        last k approximations in a preallocated ring buffer, or 'off' to
+        keep nothing.
+
+    """
+
+    __slots__ = ("limit", "shape", "_buf", "_size")
+
+    def __init__(self, policy: Union[str, int] = 'full', capacity: int = 16, shape: tuple = ()):
+
+        assert policy in ('full', 'off') or (isinstance(policy, int) and policy > 0), \
+            "history must be 'full', 'off' or a positive int"
+
+        if policy == 'full':
+            self.limit = None
+        elif policy == 'off':
+            self.limit = 0
+        else:
+            self.limit = policy
+
+        # Each approximation is an array of `shape`, a float by default.
+        self.shape = shape
+        if self.limit is None:
+            self._buf = np.empty((capacity,) + shape)
+        else:
+            self._buf = np.empty((self.limit,) + shape) if self.limit else None
+        self._size = 0
+
+
+    def append(self, x: float) -> None:
+
+        n = self._size
+
+        if self.limit is None:
+            if n == len(self._buf):
+                buf = np.empty((2 * n,) + self.shape)
+                buf[:n] = self._buf
+                self._buf = buf
+            self._buf[n] = x
+        elif self.limit:
+            self._buf[n % self.limit] = x
+
+        self._size = n + 1
+
+
+    def clear(self) -> None:
+        self._size = 0
+
+
+    def __len__(self) -> int:
+        if self.limit is None:
+            return self._size
+        return min(self._size, self.limit)
+
+
+    def to_array(self) -> np.ndarray:
+        """Return the kept approximations, oldest first."""
+        if self.limit == 0:
+            return np.empty((0,) + self.shape)
+        if self.limit is None or self._size <= self.limit:
+            return self._buf[:len(self)].copy()
+
+        i = self._size % self.limit
+        return np.concatenate((self._buf[i:], self._buf[:i]))
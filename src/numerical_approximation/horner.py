@@ -1,14 +1,21 @@
 import numpy as np
-import matplotlib.pyplot as plt
-from typing import Optional, Union
+from typing import TYPE_CHECKING, Optional, Union
+
+from .plotting import pyplot
+
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+    from matplotlib.figure import Figure
 
 """
 @author Jeremy Hopkins
 @author Iris Yang
-@version 0.1.3
+@version 0.3.0
 """
 class Horner():
 
+    __slots__ = ("poly_arr", "poly_len", "a", "b", "error", "string_func", "step")
+
     def __init__(
         self,
         poly_arr: tuple[int],
@@ -53,22 +60,59 @@ class Horner():
         return eval_array, result_arr
 
 
-    def _horner_eval(self, eval_array):
-        
-        result_arr = []
+    def roots(self, method: str = 'bracket') -> np.ndarray:
+        """Return the distinct real roots in [a, b], sorted and accurate to machine precision.
 
-        for x in eval_array:
-            result = self.poly_arr[0]
-            for j in range(1, self.poly_len):
-                result = result * x + self.poly_arr[j]
-            result_arr.append(result)
+            Args:
+                method: 'bracket' isolates one root between consecutive
+                    critical points (found recursively from the derivative)
+                    and refines it with safeguarded Newton-Horner steps.
+                    'deflation' finds all complex roots with Newton-Horner and
+                    synthetic division. 'companion' takes the eigenvalues of
+                    the companion matrix. 'aberth' moves all roots together
+                    with `BatchPolynomialRoots`. The last three polish the
+                    real roots on the original polynomial.
 
-        return result_arr
+        """
+        assert method in ('bracket', 'deflation', 'companion', 'aberth'), \
+            "method must be 'bracket', 'deflation', 'companion' or 'aberth'"
 
+        coeffs = np.trim_zeros(np.asarray(self.poly_arr[:self.poly_len], dtype=float), 'f')
 
-    def plot_solution(self, x, y):
-        fig, ax = plt.subplots()
-        fig.set_size_inches(11, 8.5)
+        if len(coeffs) < 2:
+            return np.empty(0)
+
+        if method == 'bracket':
+            return np.array(_bracket_roots(coeffs, self.a, self.b))
+
+        # Trailing zero coefficients are a root at zero of that multiplicity,
+        # exact here while the iterations only close in on it.
+        nonzero = np.trim_zeros(coeffs, 'b')
+        zeros = np.zeros(1) if len(nonzero) < len(coeffs) and self.a <= 0 <= self.b else np.empty(0)
+        if len(nonzero) < 2:
+            return zeros
+        coeffs = nonzero
+
+        if method == 'deflation':
+            candidates = _deflation_roots(coeffs)
+        elif method == 'aberth':
+            candidates, _, _ = BatchPolynomialRoots(coeffs).solve()
+        else:
+            candidates = _companion_roots(coeffs)
+
+        return np.sort(np.concatenate((zeros, _polish_real_roots(coeffs, candidates, self.a, self.b))))
+
+
+    def _horner_eval(self, eval_array, out=None, deriv=False):
+        return horner_eval(self.poly_arr[:self.poly_len], eval_array, out, deriv)
+
+
+    def plot_solution(self, x, y, roots=None, ax: Optional["Axes"] = None) -> tuple["Figure", "Axes"]:
+        if ax is None:
+            fig, ax = pyplot().subplots()
+            fig.set_size_inches(11, 8.5)
+        else:
+            fig = ax.figure
         if self.string_func is not None:
             ax.set_title("Horner Method for " + self.string_func)
         else:
@@ -76,11 +120,413 @@ class Horner():
         ax.set_xlabel("x-axis")
         ax.set_ylabel("y-axis")
         ax.plot(x, y, label='Polynomial')
-        for i in range(len(y)):
-            y_plot = y[i]
-            if (y_plot > -self.error and y_plot < self.error):
-                x_plot = x[i]
-                ax.scatter(x_plot, y_plot, s=10, label='Zeros')
+        if roots is not None:
+            ax.scatter(roots, np.zeros(len(roots)), s=10, label='Zeros')
+        else:
+            for i in range(len(y)):
+                y_plot = y[i]
+                if (y_plot > -self.error and y_plot < self.error):
+                    x_plot = x[i]
+                    ax.scatter(x_plot, y_plot, s=10, label='Zeros')
         ax.legend(loc='upper center')
         
         return fig, ax
+
+
+def horner_eval(
+    coeffs: np.ndarray,
+    x: np.ndarray,
+    out: Optional[np.ndarray] = None,
+    deriv: bool = False,
+    dout: Optional[np.ndarray] = None
+) -> Union[np.ndarray, tuple[np.ndarray, np.ndarray]]:
+    """Evaluate polynomials with the Horner scheme over whole arrays.
+
+        The loop runs over the coefficients only, every step updates all
+        points at once in place. With a 2-D `coeffs` of shape (k, n) each row
+        is a polynomial and its coefficients are broadcast against `x` with a
+        trailing axis, so a 1-D grid of m points gives a (k, m) result and an
+        `x` of shape (k, m) evaluates row i at its own points.
+
+            Args:
+                coeffs: Coefficients, highest degree first, in the last axis.
+                x: Points to evaluate at, real or complex.
+                out: Preallocated buffer for p(x).
+                deriv: Also return p'(x), computed in the same pass.
+                dout: Preallocated buffer for p'(x).
+
+    """
+    coeffs = np.asarray(coeffs)
+    x = np.asarray(x)
+
+    c = np.moveaxis(coeffs, -1, 0)[..., None] if coeffs.ndim > 1 else coeffs
+    shape = np.broadcast_shapes(c[0].shape, x.shape)
+    dtype = np.result_type(c, x, float)
+
+    if out is None:
+        out = np.empty(shape, dtype)
+    out[...] = c[0]
+
+    if deriv:
+        if dout is None:
+            dout = np.empty(shape, dtype)
+        dout[...] = 0
+
+    for j in range(1, len(c)):
+        if deriv:
+            dout *= x
+            dout += out
+        out *= x
+        out += c[j]
+
+    if deriv:
+        return out, dout
+
+    return out
+
+
+class BatchPolynomialRoots():
+
+    __slots__ = ("coeffs", "error", "max_iter", "method", "count", "converged", "solution")
+
+    def __init__(
+        self,
+        coeffs: np.ndarray,
+        error: Optional[float] = None,
+        max_iter: Optional[int] = None,
+        method: Optional[str] = None
+    ):
+        """Construct `BatchPolynomialRoots`
+
+            Finds all complex roots of every polynomial in a stack at the
+            same time. Each iteration evaluates p and p' at every current
+            root of every polynomial with `horner_eval` and moves all of them
+            at once. 'aberth' is the Aberth-Ehrlich correction
+            p/(p' - p S) with S the sum of 1/(z_i - z_j) over the other
+            roots, cubically convergent for simple roots. 'durand_kerner' is
+            the Weierstrass correction p/prod(z_i - z_j), quadratically
+            convergent and cheaper per step. A root stops moving once p is
+            zero to within the rounding bound of the Horner scheme or its
+            correction falls below `error` relative to the larger of its
+            modulus and the root scale max |a_k/a_0|^(1/k), which stops
+            roots at zero. A polynomial is dropped from the active set once
+            all of its roots have stopped, so the cost of an iteration
+            follows the polynomials that remain. The starting points lie on
+            the circle of radius |a_n/a_0|^(1/n), the geometric mean of the
+            root moduli. 'durand_kerner' can fail from there on polynomials
+            of higher degree, whose roots are then reported as not
+            converged.
+
+            Args:
+                coeffs: Coefficients, highest degree first, of shape (n + 1,)
+                    for one polynomial or (k, n + 1) for a stack of k of the
+                    same degree n. Leading coefficients must be nonzero.
+                error: Bound on the relative size of the last correction.
+                max_iter: Maximum number of iterations.
+                method: 'aberth' or 'durand_kerner'.
+
+        """
+        self.count = None
+        self.converged = None
+        self.solution = None
+
+        c = np.asarray(coeffs)
+        c = np.array(c, dtype=np.result_type(c, float))
+        assert c.ndim in (1, 2) and c.shape[-1] >= 2, "coeffs must have shape (n + 1,) or (k, n + 1) with n >= 1"
+        assert np.all(c[..., 0] != 0), "leading coefficients must be nonzero"
+        self.coeffs = c
+
+        if error is None:
+            error = 4 * np.finfo(float).eps
+
+        assert isinstance(error, float) and error > 0, "error must be a positive float"
+        self.error = error
+
+        if max_iter is None:
+            max_iter = 100
+
+        assert isinstance(max_iter, int) and max_iter > 0, "max_iter must be a positive int"
+        self.max_iter = max_iter
+
+        if method is None:
+            method = 'aberth'
+
+        assert method in ('aberth', 'durand_kerner'), "method must be 'aberth' or 'durand_kerner'"
+        self.method = method
+
+
+    def solve(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+
+        C = np.atleast_2d(self.coeffs)
+        C = C / C[:, :1]
+        absC = np.abs(C)
+        k, d = len(C), C.shape[1] - 1
+        eps = np.finfo(float).eps
+
+        # Roots at zero never pass a relative test, so corrections are also
+        # small once they fall below `error` times the root scale.
+        scale = (absC[:, 1:] ** (1 / np.arange(1, d + 1))).max(axis=1)
+        scale = np.where(scale > 0, scale, 1.0)
+
+        Z = _initial_roots(C)
+        count = np.zeros(k, dtype=int)
+        converged = np.zeros(k, dtype=bool)
+        active = np.arange(k)
+
+        for _ in range(self.max_iter):
+            if active.size == 0:
+                break
+
+            Za = Z[active]
+            with np.errstate(over='ignore', invalid='ignore'):
+                p, dp = horner_eval(C[active], Za, deriv=True)
+                zero = np.abs(p) <= 2 * (d + 1) * eps * horner_eval(absC[active], np.abs(Za))
+
+            W = self._corrections(Za, p, dp)
+            W[zero] = 0
+            Za -= W
+
+            Z[active] = Za
+            count[active] += 1
+
+            # Polynomials whose roots have left the floating point range are
+            # dropped and reported as not converged.
+            done = (zero | (np.abs(W) <= self.error * np.maximum(np.abs(Za), scale[active, None]))).all(axis=1)
+            failed = ~np.isfinite(Za).all(axis=1)
+            converged[active[done]] = True
+            active = active[~(done | failed)]
+
+        Z = np.sort(Z, axis=1)
+        if self.coeffs.ndim == 1:
+            Z, count, converged = Z[0], count[0], converged[0]
+
+        self.solution = Z
+        self.count = count
+        self.converged = converged
+
+        return self.solution, self.count, self.converged
+
+
+    def _corrections(self, Z: np.ndarray, p: np.ndarray, dp: np.ndarray) -> np.ndarray:
+
+        # Sum (or product) over the other roots one column at a time, which
+        # keeps the work arrays the size of Z.
+        T = np.empty_like(Z)
+        aberth = self.method == 'aberth'
+        acc = np.zeros_like(Z) if aberth else np.ones_like(Z)
+
+        with np.errstate(divide='ignore', over='ignore', invalid='ignore'):
+            for j in range(Z.shape[1]):
+                np.subtract(Z, Z[:, j, None], out=T)
+                if aberth:
+                    T[:, j] = np.inf
+                    np.reciprocal(T, out=T)
+                    acc += T
+                else:
+                    T[:, j] = 1
+                    acc *= T
+
+            if aberth:
+                return p / (dp - p * acc)
+            return p / acc
+
+
+def synthetic_division(coeffs: np.ndarray, r: Union[float, complex]) -> tuple[np.ndarray, Union[float, complex]]:
+    """Divide a polynomial by (x - r), returning the quotient and the remainder p(r)."""
+    q = np.empty(len(coeffs), dtype=np.result_type(coeffs, r))
+    q[0] = coeffs[0]
+    for j in range(1, len(coeffs)):
+        q[j] = q[j - 1] * r + coeffs[j]
+
+    return q[:-1], q[-1]
+
+
+def _eval_bound(coeffs: np.ndarray, x: np.ndarray) -> np.ndarray:
+    # Rounding error bound of the Horner scheme, values of p below it are zero.
+    return 2 * len(coeffs) * np.finfo(float).eps * horner_eval(np.abs(coeffs), np.abs(x))
+
+
+def _bracket_roots(coeffs: np.ndarray, a: float, b: float) -> list[float]:
+
+    if len(coeffs) < 2:
+        return []
+    if len(coeffs) == 2:
+        r = -coeffs[1]/coeffs[0]
+        return [r] if a <= r <= b else []
+
+    deriv = coeffs[:-1] * np.arange(len(coeffs) - 1, 0, -1)
+    points = np.array([a] + _bracket_roots(deriv, a, b) + [b])
+    vals = horner_eval(coeffs, points)
+    zero = np.abs(vals) <= _eval_bound(coeffs, points)
+
+    # p is monotonic between consecutive critical points, so each interval
+    # holds at most one root and a root at a critical point has even
+    # multiplicity.
+    roots = []
+    for i in range(len(points) - 1):
+        if zero[i]:
+            roots.append(points[i])
+        elif not zero[i + 1] and np.sign(vals[i]) != np.sign(vals[i + 1]):
+            roots.append(_safeguarded_newton(coeffs, points[i], points[i + 1], vals[i]))
+    if zero[-1]:
+        roots.append(points[-1])
+
+    return sorted(set(roots))
+
+
+def _safeguarded_newton(coeffs: np.ndarray, lo: float, hi: float, flo: float) -> float:
+
+    x = (lo + hi)/2
+    eps = np.finfo(float).eps
+
+    for _ in range(200):
+        p, dp = horner_eval(coeffs, x, deriv=True)
+        if p == 0:
+            return x
+
+        if np.sign(p) == np.sign(flo):
+            lo = x
+        else:
+            hi = x
+
+        x_n = x - p/dp if dp != 0 else lo
+        if not lo < x_n < hi:
+            x_n = (lo + hi)/2
+
+        if np.abs(x_n - x) <= 2 * eps * np.abs(x) or hi - lo <= 2 * eps * max(np.abs(lo), np.abs(hi)):
+            return float(x_n)
+        x = x_n
+
+    return float(x)
+
+
+def _newton_horner(coeffs: np.ndarray, z: complex, max_iter: int = 100) -> tuple[complex, bool]:
+
+    eps = np.finfo(float).eps
+
+    for _ in range(max_iter):
+        p, dp = horner_eval(coeffs, z, deriv=True)
+        if p == 0:
+            return complex(z), True
+        if dp == 0:
+            break
+        step = p/dp
+        z = z - step
+        if np.abs(step) <= 4 * eps * np.abs(z):
+            return complex(z), True
+
+    # Near a multiple root the steps stall at the rounding level of p
+    # rather than shrinking, which still counts as converged.
+    return complex(z), bool(np.abs(horner_eval(coeffs, z)) <= _eval_bound(coeffs, z))
+
+
+def _deflation_roots(coeffs: np.ndarray) -> np.ndarray:
+
+    q = coeffs.astype(complex)
+    roots = []
+
+    # Starting near the origin finds roots roughly in order of increasing
+    # modulus, which keeps the deflated coefficients well conditioned. Each
+    # root is polished on the original polynomial before dividing it out,
+    # and so is the root of the final linear factor, which carries the
+    # rounding of every division before it. Dividing by an iterate that has
+    # not converged would spoil every later quotient, so the roots of the
+    # quotient left at that point come from its companion matrix instead.
+    while len(q) > 2:
+        z, ok = _newton_horner(q, complex(0.25, 0.25))
+        if not ok:
+            rest = _companion_roots(q)
+            break
+        polished, ok = _newton_horner(coeffs, z, max_iter=5)
+        if ok:
+            z = polished
+        roots.append(z)
+        q, _ = synthetic_division(q, z)
+    else:
+        rest = [-q[1]/q[0]]
+
+    for z in rest:
+        polished, ok = _newton_horner(coeffs, z, max_iter=5)
+        roots.append(polished if ok else z)
+
+    return np.array(roots)
+
+
+def _companion_roots(coeffs: np.ndarray) -> np.ndarray:
+
+    companion = np.diag(np.ones(len(coeffs) - 2, dtype=coeffs.dtype), -1)
+    companion[0] = -coeffs[1:]/coeffs[0]
+
+    return np.linalg.eigvals(companion)
+
+
+def _initial_roots(C: np.ndarray) -> np.ndarray:
+
+    # Points on the circle of radius |a_n|^(1/n) of each monic polynomial,
+    # the geometric mean of the moduli of its roots. The offset angle keeps
+    # the points off the real axis.
+    d = C.shape[1] - 1
+    radius = np.abs(C[:, -1]) ** (1 / d)
+    radius = np.where(radius > 0, radius, 1.0)
+    angle = 2 * np.pi * np.arange(d) / d + 0.4
+
+    return radius[:, None] * np.exp(1j * angle)
+
+
+def _polish_real(coeffs: np.ndarray, x: float, max_iter: int = 50) -> float:
+
+    # Newton converges only linearly to a multiple root and its steps jump
+    # far once p' is lost in rounding, so the iterate with the smallest |p|
+    # is kept and the loop ends when p is zero to within rounding.
+    best = x
+    p_best = np.abs(horner_eval(coeffs, x))
+
+    for _ in range(max_iter):
+        if p_best <= _eval_bound(coeffs, best):
+            break
+        p, dp = horner_eval(coeffs, x, deriv=True)
+        if dp == 0:
+            break
+        x = x - p/dp
+        p_x = np.abs(horner_eval(coeffs, x))
+        if p_x < p_best:
+            best, p_best = x, p_x
+
+    return float(best)
+
+
+def _polish_real_roots(coeffs: np.ndarray, candidates: np.ndarray, a: float, b: float) -> np.ndarray:
+
+    # A root of multiplicity m comes back as m candidates spread about
+    # eps^(1/m) around it, partly off the real axis, so the imaginary parts
+    # cannot decide which roots are real. The real part of every candidate is
+    # polished on the original polynomial instead, and kept when p vanishes
+    # there to within rounding or changes sign close by.
+    eps = np.finfo(float).eps
+
+    roots = []
+    for z in candidates:
+        x = _polish_real(coeffs, z.real)
+        if not a <= x <= b:
+            continue
+        h = np.sqrt(eps) * max(1.0, np.abs(x))
+        p = horner_eval(coeffs, np.array([x - h, x, x + h]))
+        if np.abs(p[1]) <= _eval_bound(coeffs, x) or np.sign(p[0]) != np.sign(p[2]):
+            roots.append(x)
+
+    roots = np.sort(roots)
+    if len(roots) < 2:
+        return roots
+
+    # Copies of a multiple root are merged into their mean. Between two
+    # distinct roots |p| rises above its values at them and above rounding,
+    # so consecutive roots belong together when it does not, or when they
+    # agree to sqrt(eps) relative to their size.
+    mid = (roots[1:] + roots[:-1]) / 2
+    p = np.abs(horner_eval(coeffs, roots))
+    p_mid = np.abs(horner_eval(coeffs, mid))
+    same = (np.diff(roots) <= np.sqrt(eps) * np.abs(roots[1:])) \
+        | (p_mid <= np.maximum(np.maximum(p[1:], p[:-1]), _eval_bound(coeffs, mid)))
+    groups = np.cumsum(np.concatenate(([0], ~same)))
+
+    return np.array([roots[groups == g].mean() for g in range(groups[-1] + 1)])
@@ -0,0 +1,161 @@
+import math
+import time
+import numpy as np
+from typing import Callable, Hashable, NamedTuple
+
+"""
+@author Jeremy Hopkins
+@author Iris Yang
+@version 0.1.1
+"""
+class Event(NamedTuple):
+    """State of a solve after one approximation.
+
+        `step` is the change from the previous approximation and `order` the
+        convergence order estimated from the last three steps, both nan
+        until enough approximations exist. `elapsed` is the wall time in
+        seconds since the run started.
+
+    """
+    iteration: int
+    x: float
+    fx: float
+    step: float
+    order: float
+    elapsed: float
+
+
+def estimate_order(d0: float, d1: float, d2: float) -> float:
+    """Estimate the convergence order q from three successive step sizes.
+
+        With |d_{k+1}| ~ C|d_k|^q, q = log(|d2/d1|) / log(|d1/d0|). Returns nan
+        when a step is zero or not finite, or the steps do not shrink.
+
+    """
+    d0, d1, d2 = abs(d0), abs(d1), abs(d2)
+    if not (0 < d2 < d1 < d0 < math.inf):
+        return math.nan
+
+    return math.log(d2/d1) / math.log(d1/d0)
+
+
+class Tracer():
+    """Turns the approximations of one run into `Event`s for `callback`."""
+
+    __slots__ = ("callback", "start", "x", "d0", "d1")
+
+    def __init__(self, callback: Callable[[Event], None]):
+
+        assert callable(callback), "callback must be callable"
+        self.callback = callback
+        self.start = time.perf_counter()
+        self.x = self.d0 = self.d1 = math.nan
+
+
+    def __call__(self, iteration: int, x: float, fx: float) -> None:
+
+        d = x - self.x
+        # The step of a vector approximation is its Euclidean length.
+        step = float(d) if getattr(d, "ndim", 0) == 0 else math.sqrt(float(d @ d))
+        order = estimate_order(self.d0, self.d1, step)
+        self.x, self.d0, self.d1 = x, self.d1, step
+
+        self.callback(Event(iteration, x, fx, step, order, time.perf_counter() - self.start))
+
+
+class TraceCollector():
+    """Callback that keeps the event trace of every solve it is given to.
+
+        A new trace starts at every first iteration, so one collector can be
+        passed to many runs in turn. `tagged(label)` returns a callback that
+        files its traces under `label`, and `summary` reports iterations,
+        estimated order and wall time per label. Runs that overlap need a
+        callback each, from `fork` or `tagged`, which `run_all` does by
+        itself.
+
+    """
+
+    __slots__ = ("traces", "_default")
+
+    def __init__(self):
+        self.traces = []
+        self._default = _Recorder(self.traces, None)
+
+
+    def __call__(self, event: Event) -> None:
+        self._default(event)
+
+
+    def tagged(self, label: Hashable) -> Callable[[Event], None]:
+        return _Recorder(self.traces, label)
+
+
+    def fork(self) -> Callable[[Event], None]:
+        return _Recorder(self.traces, None)
+
+
+    def clear(self) -> None:
+        self.traces.clear()
+
+
+    def summary(self) -> dict:
+        """Summarize the traces of every label.
+
+            Each summary holds the number of solves, the mean and max
+            iteration count, the median and range of the per-solve order
+            estimates and the mean and total wall time.
+
+        """
+        groups = {}
+        for label, trace in self.traces:
+            groups.setdefault(label, []).append(trace)
+
+        return {label: _summarize(traces) for label, traces in groups.items()}
+
+
+class _Recorder():
+
+    # Each recorder appends to its own current trace, so recorders of the
+    # same collector can be fed by solves running at the same time.
+    __slots__ = ("traces", "label", "trace")
+
+    def __init__(self, traces: list, label: Hashable):
+        self.traces = traces
+        self.label = label
+        self.trace = None
+
+
+    def __call__(self, event: Event) -> None:
+        if event.iteration == 1 or self.trace is None:
+            self.trace = []
+            self.traces.append((self.label, self.trace))
+        self.trace.append(event)
+
+
+    def fork(self) -> "_Recorder":
+        return _Recorder(self.traces, self.label)
+
+
+def trace_order(trace: list[Event]) -> float:
+    """Return the median of the finite order estimates of a trace."""
+    orders = [e.order for e in trace if math.isfinite(e.order)]
+    return float(np.median(orders)) if orders else math.nan
+
+
+def _summarize(traces: list[list[Event]]) -> dict:
+
+    iterations = np.array([len(t) for t in traces])
+    times = np.array([t[-1].elapsed for t in traces])
+    orders = np.array([trace_order(t) for t in traces])
+    orders = orders[np.isfinite(orders)]
+
+    return {
+        "solves": len(traces),
+        "mean_iterations": float(iterations.mean()),
+        "max_iterations": int(iterations.max()),
+        "order": float(np.median(orders)) if len(orders) else math.nan,
+        "order_min": float(orders.min()) if len(orders) else math.nan,
+        "order_max": float(orders.max()) if len(orders) else math.nan,
+        "mean_time": float(times.mean()),
+        "total_time": float(times.sum()),
+    }
@@ -1,155 +1,213 @@
+import os
 import time
+import numpy as np
 
-from secant import *
-from bisection import *
-from false_position import *
-from newton import *
-from steffensen import *
-from horner import *
+from .secant import Secant
+from .bisection import Bisection
+from .false_position import FalsePosition
+from .newton import Newton
+from .steffensen import Steffensen
+from .horner import Horner
+from .cache import EvalCache
+from .plotting import pyplot
 
 """
 @author Jeremy Hopkins
 @author Iris Yang
-@version 0.2.3
+@version 0.4.0
 """
-def secant_test(f, a, b, error, string_func, sol, txt_pos) -> None:
+FIG_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fig")
+
+def _summary(method, string_func, error, sol, solver, solution, run) -> dict:
+    return {
+        "method": method,
+        "function": string_func,
+        "tolerance": error,
+        "solution": solution,
+        "error": np.abs(solution - sol),
+        "count": solver.count,
+        "nfev": solver.nfev,
+        "status": solver.result.status.value,
+        "time": run,
+        "solver": solver,
+    }
+
+def _save(fig, path, show):
+    fig.savefig(path)
+    if show:
+        pyplot().show()
+    pyplot().close(fig)
+
+def secant_test(f, a, b, error, string_func, sol, txt_pos, plot=True, verbose=True, show=False) -> dict:
     start = time.time()
     secant = Secant(f, a, b, error, string_func, sol, txt_pos)
     solution = secant.solve()
     end = time.time()
     run = end - start
 
-    print(" ")
-    print("==============================")
-    print("SECANT METHOD")
-    print("Function: " + string_func)
-    print(f"Solution: {solution}")
-    print(f"Error: {np.abs(solution - sol)}")
-    print(f"Iteration count: {secant.count}")
-    print(f"Computation time: {run:.6f}s")
-    print("==============================")
-    print(" ")
+    if verbose:
+        print(" ")
+        print("==============================")
+        print("SECANT METHOD")
+        print("Function: " + string_func)
+        print(f"Solution: {solution}")
+        print(f"Error: {np.abs(solution - sol)}")
+        print(f"Iteration count: {secant.count}")
+        print(f"Function evaluations: {secant.nfev}")
+        print(f"Computation time: {run:.6f}s")
+        print("==============================")
+        print(" ")
+
+    if plot:
+        fig, ax = secant.plot_solution()
+        _save(fig, os.path.join(FIG_DIR, f"secant_{string_func}.png"), show)
 
-    fig, ax = secant.plot_solution()
-    plt.savefig(f"./src/numerical_approximation/fig/secant_{string_func}.png")
-    plt.show()
+    return _summary("secant", string_func, error, sol, secant, solution, run)
 
-def bisection_test(f, a, b, error, string_func, sol, txt_pos):
+def bisection_test(f, a, b, error, string_func, sol, txt_pos, plot=True, verbose=True, show=False) -> dict:
     start = time.time()
     bisection = Bisection(f, a, b, error, string_func, sol, txt_pos)
     solution = bisection.solve()
     end = time.time()
     run = end - start
 
-    print(" ")
-    print("==============================")
-    print("BISECTION METHOD")
-    print("Function: " + string_func)
-    print(f"Solution: {solution}")
-    print(f"Error: {np.abs(solution - sol)}")
-    print(f"Iteration count: {bisection.count}")
-    print(f"Computation time: {run:.6f}s")
-    print("==============================")
-    print(" ")
+    if verbose:
+        print(" ")
+        print("==============================")
+        print("BISECTION METHOD")
+        print("Function: " + string_func)
+        print(f"Solution: {solution}")
+        print(f"Error: {np.abs(solution - sol)}")
+        print(f"Iteration count: {bisection.count}")
+        print(f"Function evaluations: {bisection.nfev}")
+        print(f"Computation time: {run:.6f}s")
+        print("==============================")
+        print(" ")
 
-    fig, ax = bisection.plot_solution()
-    plt.savefig(f"./src/numerical_approximation/fig/bisection_{string_func}.png")
-    plt.show()
+    if plot:
+        fig, ax = bisection.plot_solution()
+        _save(fig, os.path.join(FIG_DIR, f"bisection_{string_func}.png"), show)
 
-def false_position_test(f, a, b, error, string_func, sol, txt_pos):
+    return _summary("bisection", string_func, error, sol, bisection, solution, run)
+
+def false_position_test(f, a, b, error, string_func, sol, txt_pos, plot=True, verbose=True, show=False) -> dict:
     start = time.time()
     false_position = FalsePosition(f, a, b, error, string_func, sol, txt_pos)
     solution = false_position.solve()
     end = time.time()
     run = end - start
 
-    print(" ")
-    print("==============================")
-    print("FALSE POSITION METHOD")
-    print("Function: " + string_func)
-    print(f"Solution: {solution}")
-    print(f"Error: {np.abs(solution - sol)}")
-    print(f"Iteration count: {false_position.count}")
-    print(f"Computation time: {run:.6f}s")
-    print("==============================")
-    print(" ")
+    if verbose:
+        print(" ")
+        print("==============================")
+        print("FALSE POSITION METHOD")
+        print("Function: " + string_func)
+        print(f"Solution: {solution}")
+        print(f"Error: {np.abs(solution - sol)}")
+        print(f"Iteration count: {false_position.count}")
+        print(f"Function evaluations: {false_position.nfev}")
+        print(f"Computation time: {run:.6f}s")
+        print("==============================")
+        print(" ")
 
-    fig, ax = false_position.plot_solution()
-    plt.savefig(f"./src/numerical_approximation/fig/false_pos_{string_func}.png")
-    plt.show()
+    if plot:
+        fig, ax = false_position.plot_solution()
+        _save(fig, os.path.join(FIG_DIR, f"false_pos_{string_func}.png"), show)
 
-def newton_test(f, x, error, string_func, sol, txt_pos):
+    return _summary("false_position", string_func, error, sol, false_position, solution, run)
+
+def newton_test(f, x, error, string_func, sol, txt_pos, plot=True, verbose=True, show=False) -> dict:
     start = time.time()
     newton = Newton(f, x, error, string_func, sol, txt_pos)
     solution = newton.solve()
     end = time.time()
     run = end - start
 
-    print(" ")
-    print("==============================")
-    print("NEWTON METHOD")
-    print("Function: " + string_func)
-    print(f"Solution: {solution}")
-    print(f"Error: {np.abs(solution - sol)}")
-    print(f"Iteration count: {newton.count}")
-    print(f"Computation time: {run:.6f}s")
-    print("==============================")
-    print(" ")
+    if verbose:
+        print(" ")
+        print("==============================")
+        print("NEWTON METHOD")
+        print("Function: " + string_func)
+        print(f"Solution: {solution}")
+        print(f"Error: {np.abs(solution - sol)}")
+        print(f"Iteration count: {newton.count}")
+        print(f"Function evaluations: {newton.nfev}")
+        print(f"Computation time: {run:.6f}s")
+        print("==============================")
+        print(" ")
+
+    if plot:
+        fig, ax = newton.plot_solution()
+        _save(fig, os.path.join(FIG_DIR, f"newton_{string_func}.png"), show)
 
-    fig, ax = newton.plot_solution()
-    plt.savefig(f"./src/numerical_approximation/fig/newton_{string_func}.png")
-    plt.show()
+    return _summary("newton", string_func, error, sol, newton, solution, run)
 
-def steffensen_test(f, x, error, string_func, sol, txt_pos):
+def steffensen_test(f, x, error, string_func, sol, txt_pos, plot=True, verbose=True, show=False) -> dict:
     start = time.time()
     steffensen = Steffensen(f, x, error, string_func, sol, txt_pos)
     solution = steffensen.solve()
     end = time.time()
     run = end - start
 
-    print(" ")
-    print("==============================")
-    print("STEFFENSEN METHOD")
-    print("Function: " + string_func)
-    print(f"Solution: {solution}")
-    print(f"Error: {np.abs(solution - sol)}")
-    print(f"Iteration count: {steffensen.count}")
-    print(f"Computation time: {run:.6f}s")
-    print("==============================")
-    print(" ")
+    if verbose:
+        print(" ")
+        print("==============================")
+        print("STEFFENSEN METHOD")
+        print("Function: " + string_func)
+        print(f"Solution: {solution}")
+        print(f"Error: {np.abs(solution - sol)}")
+        print(f"Iteration count: {steffensen.count}")
+        print(f"Function evaluations: {steffensen.nfev}")
+        print(f"Computation time: {run:.6f}s")
+        print("==============================")
+        print(" ")
+
+    if plot:
+        fig, ax = steffensen.plot_solution()
+        _save(fig, os.path.join(FIG_DIR, f"steffensen_{string_func}.png"), show)
 
-    fig, ax = steffensen.plot_solution()
-    plt.savefig(f"./src/numerical_approximation/fig/steffensen_{string_func}.png")
-    plt.show()
+    return _summary("steffensen", string_func, error, sol, steffensen, solution, run)
 
-def horner_test(polynomial, a, b, error, step, string_func):
+def horner_test(polynomial, a, b, error, step, string_func, plot=True, verbose=True, show=False) -> dict:
     start = time.time()
     horner = Horner(polynomial, len(polynomial), a, b, error, step, string_func)
-    x, y = horner.solve()
+    sol_arr = horner.roots()
     end = time.time()
     run = end - start
-    
-    sol_arr = []
-    for i in range(len(y)):
-        y_sol = y[i]
-        if (y_sol > -error and y_sol < error):
-            x_sol = x[i]
-            sol_arr.append(x_sol)
 
-    print(" ")
-    print("==============================")
-    print("HORNER METHOD")
-    print("Function: " + string_func)
-    print(f"Solutions: {np.round(sol_arr[0], 2)}, {np.round(sol_arr[1], 2)}, {np.round(sol_arr[2], 2)}, {np.round(sol_arr[3], 2)}")
-    print(f"Computation time: {run:.6f}s")
-    print("==============================")
-    print(" ")
+    x, y = horner.solve()
+
+    if verbose:
+        print(" ")
+        print("==============================")
+        print("HORNER METHOD")
+        print("Function: " + string_func)
+        print(f"Solutions: {', '.join(str(np.round(sol, 2)) for sol in sol_arr)}")
+        print(f"Computation time: {run:.6f}s")
+        print("==============================")
+        print(" ")
+
+    if plot:
+        fig, ax = horner.plot_solution(x, y, sol_arr)
+        _save(fig, os.path.join(FIG_DIR, f"horner_{np.round(polynomial, 2)}.png"), show)
 
-    fig, ax = horner.plot_solution(x, y)
-    plt.savefig(f"./src/numerical_approximation/fig/horner_{np.round(polynomial, 2)}.png")
-    plt.show()
+    return {
+        "method": "horner",
+        "function": string_func,
+        "tolerance": error,
+        "solution": sol_arr,
+        "error": None,
+        "count": None,
+        "nfev": None,
+        "status": "converged",
+        "time": run,
+        "solver": horner,
+    }
 
-def newton_error_test(f, x, error, string_func):
+def newton_error_test(f, x, error, string_func, plot=True, show=False):
+    # Both Newton runs follow the same iterates, so the second one is served
+    # from the cache.
+    f = EvalCache(f)
     start = time.time()
     newton = Newton(f, x, error, string_func, np.sqrt(2))
     start = newton._find_starting_error(0.001)
@@ -166,12 +224,13 @@ def newton_error_test(f, x, error, string_func):
     print(f"Error: {np.abs(sol - np.sqrt(2))}s")
     print(f"Number of Iterations Starting at {start}: {newton_val.count}")
     print(f"Solution Starting at {start}: {sol}")
+    print(f"Cache: {f.cache_info()}")
     print("==============================")
     print(" ")
 
-    fig, ax = newton.plot_solution()
-    plt.savefig(f"./src/numerical_approximation/fig/newton_error_solution.png")
-    plt.show()
+    if plot:
+        fig, ax = newton.plot_solution()
+        _save(fig, os.path.join(FIG_DIR, f"newton_error_solution.png"), show)
 
 if __name__ == "__main__":
 
@@ -1,14 +1,24 @@
 import numpy as np
-import matplotlib.pyplot as plt
-from scipy.misc import derivative
-from typing import Optional, Union
+from typing import TYPE_CHECKING, Iterator, Optional, Union
+
+from .dual import Dual, dual_parts, fd_step
+from .basin import BasinMap, basin_map
+from .history import History
+from .root_finder import Evaluate, RootFinder
+from .plotting import plot_history
+
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+    from matplotlib.figure import Figure
 
 """
 @author Jeremy Hopkins
 @author Iris Yang
-@version 0.2.3
+@version 0.4.0
 """
-class Newton():
+class Newton(RootFinder):
+
+    __slots__ = ("x", "fprime")
 
     def __init__(
         self, 
@@ -17,7 +27,10 @@ class Newton():
         error: Optional[Union[int, float]] = None,
         string_func: Optional[str] = None,
         func_solution: Optional[float] = None,
-        txt_pos: Optional[str] = 'bottom right'
+        txt_pos: Optional[str] = 'bottom right',
+        max_iter: Optional[int] = None,
+        fprime: Optional[callable] = None,
+        history: Union[str, int] = 'full'
     ):
         """Construct `Newton`
         
@@ -28,12 +41,19 @@ class Newton():
                 string_func: String representation of function being estimated.
                 func_sol: The true soltion to the function.
                 txt_pos: Positioning for txt plotting.
+                max_iter: Maximum number of approximations.
+                fprime: Callable derivative of f. When omitted the derivative is
+                    computed with dual numbers, falling back to a central
+                    difference if f does not support them.
+                history: 'full' to keep every approximation, an int k to keep
+                    the last k, or 'off'.
 
         """
 
         self.count = 0
-        self.approx_vals = []
+        self.nfev = 0
         self.solution = 0
+        self.result = None
 
         assert callable(f), "f must be callable"
         self.f = f
@@ -58,60 +78,81 @@ class Newton():
         assert isinstance(txt_pos, str), "txt_pos must be a string"
         self.txt_pos = txt_pos
 
-        
-    def solve(self) -> float:
-
-        self.count = 0
-        self.approx_vals = []
+        if max_iter is None:
+            max_iter = 1000
 
-        self.solution = self.method(self.f, self.x)
-        return self.solution
+        assert isinstance(max_iter, int) and max_iter > 0, "max_iter must be a positive int"
+        self.max_iter = max_iter
 
-        
-    def method(self, f, x):
+        if fprime is not None:
+            assert callable(fprime), "fprime must be callable"
+        self.fprime = fprime
 
-        self.count += 1
+        self.history = History(history)
 
-        if(np.abs(f(x)) < self.error):
-            return x
         
-        x_n = x - ((f(x))/(derivative(f, x)))
-
-        self.approx_vals.append(x_n)
-
-        return self.method(f, x_n)
-
-
-    def plot_solution(self) -> tuple[plt.Figure, plt.Axes]:
-        fig, ax = plt.subplots()
-        fig.set_size_inches(11, 8.5)
-        if self.string_func is not None:
-            ax.set_title("Newton Method for " + self.string_func)
-        else:
-            ax.set_title("Newton Method")
-        ax.set_xlabel("Num Computations")
-        ax.set_ylabel("Approximation")
-        if self.txt_pos == 'bottom right':
-            ax.text(0.9675, 0.065, f'Target Solution: {self.func_solution:.1f}', ha='right', va='bottom', transform=ax.transAxes)
-        if self.txt_pos == 'bottom left':
-            ax.text(0.25, 0.065, f'Target Solution: {self.func_solution:.1f}', ha='right', va='bottom', transform=ax.transAxes)
-        if self.txt_pos == 'top left':
-            ax.text(0.25, 0.935, f'Target Solution: {self.func_solution:.1f}', ha='right', va='bottom', transform=ax.transAxes)
-        if self.txt_pos == 'top right':
-            ax.text(0.9675, 0.935, f'Target Solution: {self.func_solution:.1f}', ha='right', va='bottom', transform=ax.transAxes)
-        x = range(len(self.approx_vals))    
-        ax.plot(x, self.approx_vals, label='Approximation')
-        ax.scatter(x, self.approx_vals, s=5)
-        if self.func_solution is not None:
-            ax.axhline(y=self.func_solution, color='lightgreen', linestyle='-', label='Solution')
-        ax.legend()
+    def _iterations(self) -> Iterator[Union[Evaluate, tuple[float, float]]]:
+        return self.method(self.x)
+
         
-        return fig, ax
+    def method(self, x) -> Iterator[Union[Evaluate, tuple[float, float]]]:
+
+        derivative = self._derivative()
+
+        while True:
+            fx, d = yield from derivative(x)
+
+            yield x, fx
+
+            if d == 0:
+                return
+
+            x = x - (fx/d)
+
+
+    def basin_map(self, starts: np.ndarray, **kwargs) -> BasinMap:
+        """Run this method from every point of `starts`, see `basin.basin_map`."""
+        return basin_map(self.f, starts, 'newton', self.error, self.max_iter, fprime=self.fprime, **kwargs)
+
+
+    def plot_solution(self, ax: Optional["Axes"] = None) -> tuple["Figure", "Axes"]:
+        return plot_history(self, "Newton Method", "Num Computations", self.func_solution, ax)
     
 
+    def _derivative(self) -> callable:
+        """Return a generator function that requests `(f(x), f'(x))`."""
+        if self.fprime is not None:
+            fprime = self.fprime
+
+            def evaluate(x):
+                fx, = yield Evaluate(x)
+                d, = yield Evaluate(x, fn=fprime)
+                return fx, d
+
+            return evaluate
+
+        use_dual = True
+
+        def evaluate(x):
+            nonlocal use_dual
+            if use_dual:
+                try:
+                    y, = yield Evaluate(Dual(x, 1.0))
+                    return dual_parts(y)
+                except TypeError:
+                    use_dual = False
+            # The three points are independent, so an async run evaluates
+            # them together.
+            h = fd_step(x)
+            fx, fp, fm = yield Evaluate(x, x + h, x - h)
+            return fx, (fp - fm) / (2 * h)
+
+        return evaluate
+
+
     def _find_starting_error(self, error):
 
-        f = self.f
+        evaluate = self._derivative()
         x = self.x
         
         x3 = 999
@@ -120,12 +161,13 @@ class Newton():
 
         while np.abs(x1 - np.sqrt(2)) > error:
             # print(x)
-            x = x - ((f(x))/(derivative(f, x)))
+            fx, d = self._resolve(evaluate(x))
+            x = x - (fx/d)
 
-            self.approx_vals.append(x)
+            self.history.append(x)
 
             x3 = x2
             x2 = x1
             x1 = x
 
-        return x3
\ No newline at end of file
+        return x3
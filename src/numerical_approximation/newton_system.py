@@ -0,0 +1,363 @@
+import numpy as np
+from typing import Iterator, Optional, Union
+
+from .history import History
+from .root_finder import Evaluate, RootFinder
+
+"""
+@author Jeremy Hopkins
+@author Iris Yang
+@version 0.1.0
+"""
+class NewtonSystem(RootFinder):
+    """Newton's method for a nonlinear system F(x) = 0 of n equations in R^n.
+
+        In 'newton' mode the Jacobian is evaluated again every `refresh`
+        steps and the steps in between reuse it, so `refresh=1` is the
+        classical method and larger values give the chord method, which
+        saves the evaluations of F that a Jacobian costs. Each step solves
+        with `np.linalg.solve`. In 'broyden' mode the inverse of the first
+        Jacobian is corrected by a rank-1 update after every step, the
+        "good" Broyden update, so a step costs one evaluation of F and
+        O(n^2) work. The Jacobian is evaluated
+        again only when an update breaks down or after `refresh` steps
+        when that is given.
+
+        Without a `jacobian` it is approximated by forward differences, n
+        evaluations of F that are requested together and so run
+        concurrently under `arun`. The driver is that of the scalar
+        methods: `fx` in results and iterates is the max norm of F(x) and
+        the run converges once it falls below `error`.
+
+    """
+
+    __slots__ = ("x", "jacobian", "mode", "refresh")
+
+    def __init__(
+        self,
+        f: callable,
+        x: np.ndarray,
+        error: Optional[Union[int, float]] = None,
+        jacobian: Optional[callable] = None,
+        mode: Optional[str] = None,
+        refresh: Optional[int] = None,
+        max_iter: Optional[int] = None,
+        history: Union[str, int] = 'full'
+    ):
+        """Construct `NewtonSystem`
+
+            Args:
+                f: Callable F taking and returning arrays of shape (n,).
+                x: Starting point of shape (n,).
+                error: Bound on the max norm of F(x).
+                jacobian: Callable returning the n x n Jacobian of F at x.
+                mode: 'newton' or 'broyden'.
+                refresh: Number of steps between Jacobian evaluations, 1 for
+                    'newton' and only on breakdown for 'broyden' by default.
+                max_iter: Maximum number of approximations.
+                history: 'full' to keep every approximation, an int k to keep
+                    the last k, or 'off'.
+
+        """
+
+        self.count = 0
+        self.nfev = 0
+        self.solution = 0
+        self.result = None
+
+        assert callable(f), "f must be callable"
+        self.f = f
+
+        self.x = np.array(x, dtype=float)
+        assert self.x.ndim == 1 and self.x.size > 0, "x must be a non-empty vector"
+
+        if error is None:
+            error = 0.01
+
+        assert isinstance(error, (int, float)), "error must be int or float type"
+        self.error = error
+
+        if jacobian is not None:
+            assert callable(jacobian), "jacobian must be callable"
+        self.jacobian = jacobian
+
+        if mode is None:
+            mode = 'newton'
+
+        assert mode in ('newton', 'broyden'), "mode must be 'newton' or 'broyden'"
+        self.mode = mode
+
+        if refresh is None and mode == 'newton':
+            refresh = 1
+
+        assert refresh is None or (isinstance(refresh, int) and refresh > 0), "refresh must be a positive int"
+        self.refresh = refresh
+
+        if max_iter is None:
+            max_iter = 1000
+
+        assert isinstance(max_iter, int) and max_iter > 0, "max_iter must be a positive int"
+        self.max_iter = max_iter
+
+        self.string_func = None
+        self.func_solution = None
+        self.txt_pos = None
+
+        self.history = History(history, shape=self.x.shape)
+
+
+    def _iterations(self) -> Iterator[Union[Evaluate, tuple[np.ndarray, float]]]:
+        return self.method(self.x.copy())
+
+
+    def method(self, x) -> Iterator[Union[Evaluate, tuple[np.ndarray, float]]]:
+
+        n = len(x)
+        broyden = self.mode == 'broyden'
+
+        fx, = yield Evaluate(x)
+        fx = np.asarray(fx, dtype=float)
+        assert fx.shape == (n,), f"f must return an array of shape ({n},)"
+
+        yield x, np.abs(fx).max()
+
+        J = H = None
+        age = 0
+
+        while True:
+            if (J is None and H is None) or age == self.refresh:
+                J = yield from self._jacobian(x, fx)
+                if broyden:
+                    try:
+                        H, J = np.linalg.inv(J), None
+                    except np.linalg.LinAlgError:
+                        return
+                age = 0
+
+            if broyden:
+                dx = -(H @ fx)
+            else:
+                try:
+                    dx = -np.linalg.solve(J, fx)
+                except np.linalg.LinAlgError:
+                    return
+            if not np.any(dx):
+                return
+
+            x_new = x + dx
+            f_new, = yield Evaluate(x_new)
+            f_new = np.asarray(f_new, dtype=float)
+
+            if broyden:
+                # H <- H + (dx - H y) dx^T H / (dx^T H y) with y = F(x_new) - F(x).
+                Hy = H @ (f_new - fx)
+                denom = dx @ Hy
+                if denom != 0 and np.isfinite(denom):
+                    H += np.outer(dx - Hy, dx @ H) / denom
+                else:
+                    H = None
+
+            x, fx = x_new, f_new
+            age += 1
+
+            yield x, np.abs(fx).max()
+
+
+    def _jacobian(self, x: np.ndarray, fx: np.ndarray) -> Iterator[Evaluate]:
+
+        if self.jacobian is not None:
+            J, = yield Evaluate(x, fn=self.jacobian)
+            return np.array(J, dtype=float)
+
+        # Forward differences, row j of `points` is x + h_j e_j.
+        points = x + np.diag(_fd_steps(x))
+        h = np.diag(points) - x
+        values = yield Evaluate(*points)
+
+        return (np.array(values, dtype=float) - fx).T / h
+
+
+class BatchNewtonSystem():
+
+    __slots__ = (
+        "f", "x", "args", "error", "jacobian", "mode", "max_iter",
+        "count", "nfev", "converged", "solution"
+    )
+
+    def __init__(
+        self,
+        f: callable,
+        x: np.ndarray,
+        error: Optional[Union[int, float]] = None,
+        jacobian: Optional[callable] = None,
+        mode: Optional[str] = None,
+        max_iter: Optional[int] = None,
+        args: tuple = ()
+    ):
+        """Construct `BatchNewtonSystem`
+
+            Solves many independent systems of the same size n at once, one
+            per row of `x`. `f` is called once per iteration on the rows of
+            every system that has not yet converged, so it must map an
+            array of shape (k, n) to one of shape (k, n). The linear
+            solves of all systems are one stacked NumPy call. A finite
+            difference Jacobian costs a single call of `f` on k n points.
+            'broyden' inverts the first Jacobians together and then only
+            applies rank-1 updates. Systems whose Jacobian is singular or
+            whose iterates stop being finite are dropped and reported as
+            not converged.
+
+            Args:
+                f: Vectorized callable F.
+                x: Starting points of shape (m, n).
+                error: Bound on the max norm of F(x) per system.
+                jacobian: Vectorized callable returning Jacobians of shape
+                    (k, n, n) for points of shape (k, n).
+                mode: 'newton' or 'broyden'.
+                max_iter: Maximum number of steps per system.
+                args: Extra arrays with a leading axis of length m passed to
+                    `f` and `jacobian`, masked together with the systems.
+
+        """
+        self.count = None
+        self.nfev = None
+        self.converged = None
+        self.solution = None
+
+        assert callable(f), "f must be callable"
+        self.f = f
+
+        self.x = np.array(x, dtype=float)
+        assert self.x.ndim == 2 and self.x.size > 0, "x must have shape (m, n)"
+
+        self.args = tuple(np.asarray(arg) for arg in args)
+        assert all(len(arg) == len(self.x) for arg in self.args), "args must have a leading axis of length m"
+
+        if error is None:
+            error = 0.01
+
+        assert isinstance(error, (int, float)), "error must be int or float type"
+        self.error = error
+
+        if jacobian is not None:
+            assert callable(jacobian), "jacobian must be callable"
+        self.jacobian = jacobian
+
+        if mode is None:
+            mode = 'newton'
+
+        assert mode in ('newton', 'broyden'), "mode must be 'newton' or 'broyden'"
+        self.mode = mode
+
+        if max_iter is None:
+            max_iter = 100
+
+        assert isinstance(max_iter, int) and max_iter > 0, "max_iter must be a positive int"
+        self.max_iter = max_iter
+
+
+    def solve(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+
+        X = self.x.copy()
+        m, n = X.shape
+        F = self._f(X, np.arange(m))
+
+        count = np.zeros(m, dtype=int)
+        nfev = np.ones(m, dtype=int)
+        converged = np.abs(F).max(axis=1) < self.error
+        active = np.flatnonzero(~converged)
+
+        H = None
+        if self.mode == 'broyden' and active.size:
+            J = self._jacobian(X[active], F[active], active, nfev)
+            H = np.zeros((m, n, n))
+            H[active], ok = _stacked_solve(J, np.broadcast_to(np.eye(n), J.shape))
+            active = active[ok]
+
+        for _ in range(self.max_iter):
+            if active.size == 0:
+                break
+
+            Xa, Fa = X[active], F[active]
+
+            if H is None:
+                J = self._jacobian(Xa, Fa, active, nfev)
+                dx, ok = _stacked_solve(J, Fa[:, :, None])
+                dx = -dx[:, :, 0]
+            else:
+                Ha = H[active]
+                dx = -np.einsum('kij,kj->ki', Ha, Fa)
+                ok = np.ones(len(active), dtype=bool)
+
+            Xn = Xa + dx
+            Fn = self._f(Xn, active)
+            nfev[active] += 1
+
+            if H is not None:
+                Hy = np.einsum('kij,kj->ki', Ha, Fn - Fa)
+                denom = np.einsum('ki,ki->k', dx, Hy)
+                # Systems whose update breaks down keep their inverse.
+                use = (denom != 0) & np.isfinite(denom)
+                sH = np.einsum('ki,kij->kj', dx, Ha)
+                Ha += np.where(use[:, None, None], (dx - Hy)[:, :, None] * sH[:, None, :], 0.0) \
+                    / np.where(use, denom, 1.0)[:, None, None]
+                H[active] = Ha
+
+            X[active] = np.where(ok[:, None], Xn, Xa)
+            F[active] = np.where(ok[:, None], Fn, Fa)
+            count[active] += ok
+
+            done = ok & (np.abs(Fn).max(axis=1) < self.error)
+            failed = ~ok | ~np.isfinite(Xn).all(axis=1) | ~np.isfinite(Fn).all(axis=1) | ~dx.any(axis=1)
+            converged[active[done]] = True
+            active = active[~(done | failed)]
+
+        self.solution = X
+        self.count = count
+        self.nfev = nfev
+        self.converged = converged
+
+        return self.solution, self.count, self.converged
+
+
+    def _f(self, X: np.ndarray, lanes: np.ndarray) -> np.ndarray:
+        return np.asarray(self.f(X, *(arg[lanes] for arg in self.args)), dtype=float)
+
+
+    def _jacobian(self, X: np.ndarray, F: np.ndarray, lanes: np.ndarray, nfev: np.ndarray) -> np.ndarray:
+
+        if self.jacobian is not None:
+            return np.asarray(self.jacobian(X, *(arg[lanes] for arg in self.args)), dtype=float)
+
+        # Forward differences for all systems in one call, P[k, j] = X[k] + h_kj e_j.
+        k, n = X.shape
+        P = X[:, None, :] + _fd_steps(X)[:, :, None] * np.eye(n)
+        h = np.diagonal(P, axis1=1, axis2=2) - X
+        FP = self._f(P.reshape(k * n, n), np.repeat(lanes, n)).reshape(k, n, n)
+        nfev[lanes] += n
+
+        return np.swapaxes((FP - F[:, None, :]) / h[:, :, None], 1, 2)
+
+
+def _fd_steps(x: np.ndarray) -> np.ndarray:
+    return np.sqrt(np.finfo(float).eps) * np.maximum(1.0, np.abs(x))
+
+
+def _stacked_solve(A: np.ndarray, B: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Solve a stack of systems, returning the solutions and a mask of the nonsingular ones."""
+    try:
+        return np.linalg.solve(A, B), np.ones(len(A), dtype=bool)
+    except np.linalg.LinAlgError:
+        pass
+
+    # One singular matrix fails the whole stacked call, so fall back to
+    # solving one system at a time.
+    X = np.zeros(np.broadcast_shapes(A.shape[:-1] + B.shape[-1:], B.shape))
+    ok = np.ones(len(A), dtype=bool)
+    for i in range(len(A)):
+        try:
+            X[i] = np.linalg.solve(A[i], B[i])
+        except np.linalg.LinAlgError:
+            ok[i] = False
+
+    return X, ok
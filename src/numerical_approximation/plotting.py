@@ -0,0 +1,118 @@
+import os
+import sys
+from typing import TYPE_CHECKING, Iterable, Optional
+
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+    from matplotlib.figure import Figure
+
+"""
+@author Jeremy Hopkins
+@author Iris Yang
+@version 0.1.0
+"""
+TXT_POS = {
+    'bottom right': (0.9675, 0.065),
+    'bottom left': (0.25, 0.065),
+    'top left': (0.25, 0.935),
+    'top right': (0.9675, 0.935),
+}
+
+
+def pyplot():
+    """Import and return `matplotlib.pyplot` on first use.
+
+        The solver modules never import matplotlib themselves, so solving
+        does not pay its import time. The Agg backend is selected unless
+        pyplot was already imported or a backend is set through the
+        MPLBACKEND environment variable.
+
+    """
+    if "matplotlib.pyplot" not in sys.modules and "MPLBACKEND" not in os.environ:
+        import matplotlib
+        matplotlib.use("Agg")
+
+    import matplotlib.pyplot as plt
+    return plt
+
+
+def plot_history(
+    solver,
+    title: str,
+    xlabel: str,
+    solution: Optional[float],
+    ax: Optional["Axes"] = None
+) -> tuple["Figure", "Axes"]:
+    """Draw the approximation history of `solver`, on `ax` if given."""
+    if ax is None:
+        fig, ax = pyplot().subplots()
+        fig.set_size_inches(11, 8.5)
+    else:
+        fig = ax.figure
+
+    if solver.string_func is not None:
+        ax.set_title(title + " for " + solver.string_func)
+    else:
+        ax.set_title(title)
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel("Approximation")
+    if solver.func_solution is not None and solver.txt_pos in TXT_POS:
+        x, y = TXT_POS[solver.txt_pos]
+        ax.text(x, y, f'Target Solution: {solver.func_solution:.1f}', ha='right', va='bottom', transform=ax.transAxes)
+    approx_vals = solver.approx_vals
+    ax.plot(range(len(approx_vals)), approx_vals, label='Approximation')
+    ax.scatter(range(len(approx_vals)), approx_vals, s=5)
+    if solver.func_solution is not None:
+        ax.axhline(y=solution, color='lightgreen', linestyle='-', label='Solution')
+    ax.legend()
+
+    return fig, ax
+
+
+def render_each(solvers: Iterable, paths: Iterable[str], size: tuple[float, float] = (11, 8.5)) -> None:
+    """Save one plot per solver, reusing a single figure for all of them.
+
+        Each item of `solvers` is a solver with `plot_solution(ax=...)` or a
+        callable that draws onto the Axes it is given.
+
+    """
+    plt = pyplot()
+    fig, ax = plt.subplots()
+    fig.set_size_inches(*size)
+
+    try:
+        for solver, path in zip(solvers, paths):
+            ax.clear()
+            _draw(solver, ax)
+            fig.savefig(path)
+    finally:
+        plt.close(fig)
+
+
+def render_grid(solvers: list, path: str, ncols: int = 3, size: tuple[float, float] = (5, 4)) -> None:
+    """Save the plots of all solvers as small multiples in one figure.
+
+        Items of `solvers` are the same as for `render_each`.
+
+    """
+    plt = pyplot()
+    nrows = max(1, -(-len(solvers) // ncols))
+    fig, axes = plt.subplots(nrows, ncols, squeeze=False)
+    fig.set_size_inches(size[0] * ncols, size[1] * nrows)
+
+    try:
+        for ax, solver in zip(axes.flat, solvers):
+            _draw(solver, ax)
+        for ax in axes.flat[len(solvers):]:
+            ax.set_visible(False)
+        fig.tight_layout()
+        fig.savefig(path)
+    finally:
+        plt.close(fig)
+
+
+def _draw(solver, ax: "Axes") -> None:
+    if hasattr(solver, "plot_solution"):
+        solver.plot_solution(ax=ax)
+    else:
+        solver(ax)
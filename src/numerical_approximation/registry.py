@@ -0,0 +1,117 @@
+import numpy as np
+from importlib import import_module
+from typing import Callable, NamedTuple, Optional, Union
+
+"""
+@author Jeremy Hopkins
+@author Iris Yang
+@version 0.1.1
+"""
+class MethodInfo(NamedTuple):
+    """Capabilities of a registered method.
+
+        `module` and `cls` name the class, which is only imported when the
+        method is first used. A bracketing method is constructed as
+        `cls(f, a, b, error, ...)` and an open method as `cls(f, x, error, ...)`.
+        `derivative` marks methods that use f', and `vectorizable` methods
+        that solve many independent lanes in one call on array inputs.
+
+    """
+    module: str
+    cls: str
+    bracketing: bool
+    derivative: bool
+    vectorizable: bool
+
+    def load(self) -> type:
+        return getattr(import_module("." + self.module, __package__), self.cls)
+
+
+METHODS = {
+    "bisection": MethodInfo("bisection", "Bisection", True, False, False),
+    "batch_bisection": MethodInfo("bisection", "BatchBisection", True, False, True),
+    "false_position": MethodInfo("false_position", "FalsePosition", True, False, False),
+    "secant": MethodInfo("secant", "Secant", True, False, False),
+    "brent": MethodInfo("brent", "Brent", True, False, False),
+    "newton": MethodInfo("newton", "Newton", False, True, False),
+    "steffensen": MethodInfo("steffensen", "Steffensen", False, False, False),
+}
+
+
+def register(name: str, info: MethodInfo) -> None:
+    """Add a method to the registry, or replace the one of the same name."""
+    assert isinstance(name, str), "name must be a string"
+    assert isinstance(info, MethodInfo), "info must be a MethodInfo"
+    METHODS[name] = info
+
+
+def choose(
+    a: Optional[object] = None,
+    b: Optional[object] = None,
+    x: Optional[object] = None
+) -> str:
+    """Return the method `solve(method="auto")` uses for the given inputs.
+
+        A bracket is preferred because it guarantees convergence: Brent for
+        scalars and the batched bisection when a or b is a sequence or array.
+        A starting value alone selects Newton.
+
+    """
+    if a is not None and b is not None:
+        if np.ndim(a) == 0 and np.ndim(b) == 0:
+            return "brent"
+        return "batch_bisection"
+    assert x is not None, "auto needs a bracket a, b or a starting value x"
+    return "newton"
+
+
+def solve(
+    f: callable,
+    a: Optional[object] = None,
+    b: Optional[object] = None,
+    x: Optional[Union[int, float]] = None,
+    error: Optional[Union[int, float]] = None,
+    method: str = "auto",
+    callback: Optional[Callable] = None,
+    **kwargs
+):
+    """Find a root of f with a registered method.
+
+        Args:
+            f: Callable representation of function to be estimated.
+            a: Min point value, for bracketing methods.
+            b: Max point value, for bracketing methods.
+            x: Starting value, for open methods.
+            error: Error bounds.
+            method: A name in `METHODS`, or 'auto' to pick one with `choose`.
+            callback: Called with an `Event` for every approximation. Not
+                supported by vectorizable methods.
+            kwargs: Extra arguments for the method class, such as `max_iter`.
+
+        Returns:
+            The `SolverResult` of the run, or for a vectorizable method the
+            `(roots, count, converged)` tuple of its `solve`.
+
+    """
+    if method == "auto":
+        method = choose(a, b, x)
+    assert method in METHODS, f"method must be 'auto' or one of {list(METHODS)}"
+
+    info = METHODS[method]
+    cls = info.load()
+
+    if not info.vectorizable:
+        # The scalar classes take Python numbers, not NumPy scalars or 0-d arrays.
+        a, b, x = (v.item() if isinstance(v, (np.generic, np.ndarray)) and np.ndim(v) == 0 else v for v in (a, b, x))
+
+    if info.bracketing:
+        assert a is not None and b is not None, f"{method} needs a bracket a, b"
+        solver = cls(f, a, b, error, **kwargs)
+    else:
+        assert x is not None, f"{method} needs a starting value x"
+        solver = cls(f, x, error, **kwargs)
+
+    if info.vectorizable:
+        assert callback is None, f"{method} does not support callbacks"
+        return solver.solve()
+    return solver.run(callback)
@@ -0,0 +1,472 @@
+import asyncio
+import inspect
+import threading
+import time
+import numpy as np
+from enum import Enum
+from typing import AsyncIterator, Callable, Generator, NamedTuple, Optional, Union
+
+from .instrument import Event, Tracer
+
+"""
+@author Jeremy Hopkins
+@author Iris Yang
+@version 0.5.0
+"""
+class Status(Enum):
+
+    CONVERGED = "converged"
+    MAX_ITER = "max_iter"
+    DIVERGED = "diverged"
+    FAILED = "failed"
+    DEADLINE = "deadline"
+    MAX_NFEV = "max_nfev"
+    CANCELLED = "cancelled"
+
+
+class SolverResult(NamedTuple):
+
+    root: float
+    iterations: int
+    nfev: int
+    residual: float
+    status: Status
+
+    @property
+    def converged(self) -> bool:
+        return self.status is Status.CONVERGED
+
+
+class Iterate(NamedTuple):
+    """One approximation of a streamed solve.
+
+        `bracket` is the interval `(lo, hi)` known to contain a root after
+        this step for the bracketing methods and None for the others.
+        `elapsed` is the wall time in seconds since the run started.
+
+    """
+    iteration: int
+    x: float
+    fx: float
+    nfev: int
+    bracket: Optional[tuple[float, float]]
+    elapsed: float
+
+
+class Evaluate():
+    """Request from a method generator to evaluate f at one or more points.
+
+        A method does `fa, fb = yield Evaluate(a, b)` and receives the values
+        in order, always as a tuple. The points of one request are
+        independent, so an asynchronous driver evaluates them concurrently.
+        An exception raised by f is thrown back into the method at the
+        `yield`. With `fn`, that function is evaluated instead of f and
+        the calls do not count towards `nfev`.
+
+    """
+
+    __slots__ = ("points", "fn")
+
+    def __init__(self, *points, fn: Optional[callable] = None):
+        self.points = points
+        self.fn = fn
+
+
+class RootFinder():
+    """Iterative driver shared by the scalar root finding methods.
+
+        Subclasses implement `method` as a generator that never calls f
+        itself. It yields `Evaluate` requests for the values it needs and
+        `(x, f(x))` for every new approximation, or `(x, f(x), (lo, hi))`
+        when it keeps a bracket, and `_iterations` starts it
+        from the values given to the constructor. The driver stops as soon
+        as `|f(x)| < error`, after `max_iter` approximations, when an
+        approximation is no longer finite, or when the method has no next
+        approximation to offer. A method that can certify convergence by
+        other means, such as the width of its bracket, returns
+        `Status.CONVERGED` after yielding its final approximation. Every
+        evaluation is counted in `nfev`, so methods should carry known
+        function values forward instead of requesting the same point twice.
+
+        `run` fulfils the requests by calling f. `arun` is the same solve
+        as a coroutine for an f that returns awaitables, such as a call
+        into a remote service: the points of a request are awaited
+        concurrently, and a shared `asyncio.Semaphore` bounds the number of
+        evaluations in flight across many solves on one event loop.
+
+        `iterate` streams the solve, yielding an `Iterate` with x, f(x) and
+        the bracket where there is one for every approximation. `run`,
+        `iterate` and their async versions also take a wall time
+        `deadline`, an evaluation budget `max_nfev` and a `cancel` event.
+        A run stopped by one of them reports the approximation with the
+        smallest |f(x)| so far, with the matching status.
+
+        Approximations are recorded in `history` according to its policy and
+        read back through `approx_vals`. A `callback` given to `run` or
+        `solve` receives an `Event` for every approximation, carrying the
+        step size, an estimate of the convergence order and the wall time.
+        Without a callback none of this is computed.
+
+    """
+
+    __slots__ = (
+        "f", "error", "count", "nfev", "solution", "result", "max_iter",
+        "history", "string_func", "func_solution", "txt_pos"
+    )
+
+    @property
+    def approx_vals(self) -> np.ndarray:
+        return self.history.to_array()
+
+
+    def solve(
+        self,
+        callback: Optional[Callable[[Event], None]] = None,
+        deadline: Optional[Union[int, float]] = None,
+        max_nfev: Optional[int] = None,
+        cancel: Optional[threading.Event] = None
+    ) -> float:
+
+        self.result = self.run(callback, deadline, max_nfev, cancel)
+        return self.solution
+
+
+    def run(
+        self,
+        callback: Optional[Callable[[Event], None]] = None,
+        deadline: Optional[Union[int, float]] = None,
+        max_nfev: Optional[int] = None,
+        cancel: Optional[threading.Event] = None
+    ) -> SolverResult:
+        """Run the solve, calling f for every evaluation.
+
+            Args:
+                callback: Receives an `Event` for every approximation.
+                deadline: Wall time budget in seconds. No evaluation is
+                    started once it has passed.
+                max_nfev: Maximum number of evaluations of f.
+                cancel: Object with an `is_set` method, such as a
+                    `threading.Event`, that stops the run once set.
+
+        """
+        # The requests are fulfilled inside the session, so a synchronous
+        # solve pays for one generator layer, not two.
+        try:
+            next(self._session(callback, _budget(deadline, max_nfev, cancel), inline=True))
+        except StopIteration as stop:
+            return stop.value
+
+
+    def iterate(
+        self,
+        deadline: Optional[Union[int, float]] = None,
+        max_nfev: Optional[int] = None,
+        cancel: Optional[threading.Event] = None
+    ) -> Generator[Iterate, None, SolverResult]:
+        """Run the solve step by step, yielding an `Iterate` for every approximation.
+
+            The limits are those of `run`. The generator returns the
+            `SolverResult`, which is also stored in `result`. Closing it
+            early stops the solve between two evaluations; the last
+            iterate received is then the current state.
+
+        """
+        self.result = yield from self._session(None, _budget(deadline, max_nfev, cancel), inline=True, stream=True)
+        return self.result
+
+
+    async def asolve(
+        self,
+        callback: Optional[Callable[[Event], None]] = None,
+        semaphore: Optional[asyncio.Semaphore] = None,
+        deadline: Optional[Union[int, float]] = None,
+        max_nfev: Optional[int] = None,
+        cancel: Optional[threading.Event] = None
+    ) -> float:
+
+        self.result = await self.arun(callback, semaphore, deadline, max_nfev, cancel)
+        return self.solution
+
+
+    async def arun(
+        self,
+        callback: Optional[Callable[[Event], None]] = None,
+        semaphore: Optional[asyncio.Semaphore] = None,
+        deadline: Optional[Union[int, float]] = None,
+        max_nfev: Optional[int] = None,
+        cancel: Optional[threading.Event] = None
+    ) -> SolverResult:
+        """Run the solve as a coroutine, awaiting every evaluation of f.
+
+            f may return an awaitable or a plain value. The points of one
+            request are evaluated concurrently, each holding `semaphore`
+            while it runs when one is given. The limits are those of `run`,
+            except that `deadline` is a hard bound: evaluations still in
+            flight when it passes are cancelled.
+
+        """
+        budget = _budget(deadline, max_nfev, cancel)
+        async for _ in self._adrive(self._session(callback, budget), budget, semaphore):
+            pass
+
+        return self.result
+
+
+    async def aiterate(
+        self,
+        semaphore: Optional[asyncio.Semaphore] = None,
+        deadline: Optional[Union[int, float]] = None,
+        max_nfev: Optional[int] = None,
+        cancel: Optional[threading.Event] = None
+    ) -> AsyncIterator[Iterate]:
+        """Asynchronous `iterate`, with the evaluations of `arun`. The result is stored in `result`."""
+        budget = _budget(deadline, max_nfev, cancel)
+        async for step in self._adrive(self._session(None, budget, stream=True), budget, semaphore):
+            yield step
+
+
+    async def _adrive(
+        self,
+        session: Generator,
+        budget: Optional["Budget"],
+        semaphore: Optional[asyncio.Semaphore]
+    ) -> AsyncIterator[Iterate]:
+
+        values = error = None
+
+        while True:
+            try:
+                step = session.send(values) if error is None else session.throw(error)
+            except StopIteration as stop:
+                self.result = stop.value
+                return
+
+            values = error = None
+            if type(step) is Iterate:
+                yield step
+                continue
+
+            fn = self.f if step.fn is None else step.fn
+            try:
+                if budget is None or budget.end is None:
+                    values = await evaluate_async(fn, step.points, semaphore)
+                else:
+                    values = await asyncio.wait_for(evaluate_async(fn, step.points, semaphore), budget.remaining())
+            except asyncio.TimeoutError as e:
+                error = _Expired() if budget is not None and budget.end is not None and budget.remaining() <= 0 else e
+            except Exception as e:
+                error = e
+
+
+    def _session(
+        self,
+        callback: Optional[Callable[[Event], None]],
+        budget: Optional["Budget"] = None,
+        inline: bool = False,
+        stream: bool = False
+    ) -> Generator[Union[Evaluate, Iterate], tuple, SolverResult]:
+
+        self.count = 0
+        self.nfev = 0
+        self.history.clear()
+        record = self.history.append
+        trace = None if callback is None else Tracer(callback)
+        start = time.perf_counter() if stream else 0.0
+
+        f = self.f
+        x = fx = np.nan
+        best_x, best_fx = np.nan, np.inf
+        bracket = None
+        iterations = self._iterations()
+        values = error = None
+
+        while True:
+            try:
+                step = iterations.send(values) if error is None else iterations.throw(error)
+            except StopIteration as stop:
+                status = Status.FAILED if stop.value is None else stop.value
+                break
+
+            values = error = None
+            if type(step) is Evaluate:
+                points, fn = step.points, step.fn
+                if budget is not None:
+                    status = budget.check(self.nfev + len(points) if fn is None else self.nfev)
+                    if status is not None:
+                        break
+                if fn is None:
+                    self.nfev += len(points)
+                    fn = f
+                try:
+                    if not inline:
+                        values = yield step
+                    elif len(points) == 1:
+                        values = (fn(points[0]),)
+                    else:
+                        values = tuple([fn(x) for x in points])
+                except _Expired:
+                    status = Status.DEADLINE
+                    break
+                except Exception as e:
+                    error = e
+                continue
+
+            if len(step) == 2:
+                x, fx = step
+            else:
+                x, fx, bracket = step
+            self.count += 1
+            record(x)
+            if trace is not None:
+                trace(self.count, x, fx)
+            if abs(fx) < abs(best_fx):
+                best_x, best_fx = x, fx
+            if stream:
+                yield Iterate(self.count, x, fx, self.nfev, bracket, time.perf_counter() - start)
+
+            if not (np.isfinite(x).all() and np.isfinite(fx)):
+                status = Status.DIVERGED
+                break
+            if np.abs(fx) < self.error:
+                status = Status.CONVERGED
+                break
+            if self.count >= self.max_iter:
+                status = Status.MAX_ITER
+                break
+
+        # A run cut short by a budget reports the best approximation it has
+        # seen rather than the last one.
+        if status in (Status.DEADLINE, Status.MAX_NFEV, Status.CANCELLED):
+            x, fx = best_x, best_fx
+
+        self.solution = x
+
+        return SolverResult(x, self.count, self.nfev, np.abs(fx), status)
+
+
+    def _evaluate(self, request: Evaluate) -> tuple:
+
+        fn = self.f if request.fn is None else request.fn
+        return tuple([fn(x) for x in request.points])
+
+
+    def _resolve(self, requests: Generator[Evaluate, tuple, object]) -> object:
+        """Fulfil every request of a generator that only evaluates f and return its result."""
+        values = error = None
+
+        while True:
+            try:
+                request = requests.send(values) if error is None else requests.throw(error)
+            except StopIteration as stop:
+                return stop.value
+
+            values = error = None
+            try:
+                values = self._evaluate(request)
+            except Exception as e:
+                error = e
+
+
+    def _iterations(self) -> Generator[Union[Evaluate, tuple[float, float]], tuple, Optional[Status]]:
+        raise NotImplementedError
+
+
+class Budget():
+    """Limits of one run beyond `max_iter`, checked before every evaluation of f."""
+
+    __slots__ = ("end", "max_nfev", "cancel")
+
+    def __init__(
+        self,
+        deadline: Optional[Union[int, float]] = None,
+        max_nfev: Optional[int] = None,
+        cancel: Optional[threading.Event] = None
+    ):
+        """Construct `Budget`
+
+            Args:
+                deadline: Wall time budget in seconds from now.
+                max_nfev: Maximum number of evaluations of f.
+                cancel: Object with an `is_set` method that ends the run once set.
+
+        """
+        assert deadline is None or (isinstance(deadline, (int, float)) and deadline >= 0), "deadline must be a non-negative int or float"
+        assert max_nfev is None or (isinstance(max_nfev, int) and max_nfev > 0), "max_nfev must be a positive int"
+        assert cancel is None or callable(getattr(cancel, "is_set", None)), "cancel must have an is_set method"
+
+        self.end = None if deadline is None else time.perf_counter() + deadline
+        self.max_nfev = max_nfev
+        self.cancel = cancel
+
+
+    def remaining(self) -> float:
+        return np.inf if self.end is None else self.end - time.perf_counter()
+
+
+    def check(self, nfev: int) -> Optional[Status]:
+        """Return the status that ends the run before f is evaluated up to `nfev` times, or None."""
+        if self.cancel is not None and self.cancel.is_set():
+            return Status.CANCELLED
+        if self.max_nfev is not None and nfev > self.max_nfev:
+            return Status.MAX_NFEV
+        if self.end is not None and time.perf_counter() >= self.end:
+            return Status.DEADLINE
+        return None
+
+
+def _budget(
+    deadline: Optional[Union[int, float]],
+    max_nfev: Optional[int],
+    cancel: Optional[threading.Event]
+) -> Optional[Budget]:
+
+    if deadline is None and max_nfev is None and cancel is None:
+        return None
+    return Budget(deadline, max_nfev, cancel)
+
+
+class _Expired(Exception):
+    """Thrown into a session when its deadline passes during an evaluation."""
+
+
+async def evaluate_async(fn: callable, points: tuple, semaphore: Optional[asyncio.Semaphore] = None) -> tuple:
+    """Evaluate fn at every point concurrently, awaiting results that are awaitable."""
+
+    async def one(x):
+        if semaphore is None:
+            y = fn(x)
+            return await y if inspect.isawaitable(y) else y
+        async with semaphore:
+            y = fn(x)
+            return await y if inspect.isawaitable(y) else y
+
+    if len(points) == 1:
+        return (await one(points[0]),)
+
+    return tuple(await asyncio.gather(*[one(x) for x in points]))
+
+
+async def run_all(
+    solvers: list[RootFinder],
+    limit: Optional[int] = None,
+    callback: Optional[Callable[[Event], None]] = None,
+    deadline: Optional[Union[int, float]] = None
+) -> list[SolverResult]:
+    """Run many solves concurrently on the current event loop.
+
+        At most `limit` evaluations of f are in flight at any time across
+        all of the solves, or any number when it is omitted. Each solve
+        returns its best approximation once `deadline` seconds have passed.
+        The results are in the order of `solvers`. A callback with a `fork`
+        method, such as a `TraceCollector`, is forked for every solve so the
+        events of different solves are kept apart, any other callback gets
+        the events of all solves interleaved.
+
+    """
+    assert limit is None or (isinstance(limit, int) and limit > 0), "limit must be a positive int"
+
+    fork = getattr(callback, "fork", None)
+    callbacks = [fork() if fork is not None else callback for _ in solvers]
+
+    semaphore = None if limit is None else asyncio.Semaphore(limit)
+    return list(await asyncio.gather(*[s.arun(c, semaphore, deadline) for s, c in zip(solvers, callbacks)]))
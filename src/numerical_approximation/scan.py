@@ -0,0 +1,250 @@
+import asyncio
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Optional, Union
+
+from .bisection import Bisection, BatchBisection
+from .brent import Brent
+from .chebyshev import Chebyshev
+from .false_position import FalsePosition
+from .root_finder import evaluate_async
+
+"""
+@author Jeremy Hopkins
+@author Iris Yang
+@version 0.2.1
+"""
+METHODS = {
+    "brent": Brent,
+    "bisection": Bisection,
+    "false_position": FalsePosition,
+}
+
+
+def find_roots(
+    f: callable,
+    a: Union[int, float],
+    b: Union[int, float],
+    n: Optional[int] = None,
+    error: Optional[Union[int, float]] = None,
+    method: str = 'brent',
+    executor: Optional[str] = None,
+    max_workers: Optional[int] = None,
+    **kwargs
+) -> np.ndarray:
+    """Return every root of f found on [a, b], sorted and deduplicated.
+
+        f is sampled on a grid of n points, vectorized when f accepts arrays.
+        Every sign change gives a bracket that is refined with `method`, and
+        the refined point is kept only when |f| there is within a small
+        multiple of `error`, so poles and jumps are not reported. Local
+        minima of |f| without a sign change are searched for roots of even
+        multiplicity that the grid only touches, but only those whose
+        parabola through the neighbouring samples comes close to zero. The
+        searches run together when f is vectorized and on the pool
+        otherwise. Roots closer together than the grid can resolve may be
+        missed, so n should exceed the number of expected roots by a
+        comfortable margin.
+
+        Args:
+            f: Callable representation of function to be estimated.
+            a: Min point value.
+            b: Max point value.
+            n: Number of grid points.
+            error: Error bounds for the refinement.
+            method: 'brent', 'bisection' or 'false_position'. Bisection on a
+                vectorized f refines every bracket in one batch. 'chebyshev'
+                finds the roots of a Chebyshev proxy of f instead of
+                sampling a grid, see `Chebyshev`; n, error and executor are
+                not used. f must be smooth on [a, b], otherwise a
+                RuntimeWarning is issued and the roots may be inaccurate.
+            executor: None to refine in this thread, 'thread' or 'process' to
+                refine brackets on a pool. A process pool needs a picklable f.
+            max_workers: Pool size.
+            kwargs: Extra arguments for the method class, such as `mode`.
+
+    """
+    assert isinstance(a, (int, float)) and isinstance(b, (int, float)) and a < b, "a and b must be numbers with a < b"
+
+    if method == 'chebyshev':
+        return Chebyshev(f, a, b, **kwargs).roots()
+
+    assert method in METHODS, f"method must be one of {list(METHODS)} or 'chebyshev'"
+    assert executor in (None, 'thread', 'process'), "executor must be None, 'thread' or 'process'"
+
+    if n is None:
+        n = 1001
+    assert isinstance(n, int) and n >= 3, "n must be an int of at least 3"
+
+    if error is None:
+        error = 1e-12
+
+    x = np.linspace(a, b, n)
+    y, vectorized = _sample(f, x)
+    s = np.sign(y)
+
+    roots = list(x[s == 0])
+
+    change = np.flatnonzero(s[:-1] * s[1:] < 0)
+    lo = x[change]
+    hi = x[change + 1]
+
+    # Interior local minima of |f| where the sign does not change, kept
+    # only when the parabola through the three samples reaches down to
+    # about zero, so minima that stay clear of zero cost nothing.
+    ay = np.abs(y)
+    i = np.arange(1, n - 1)
+    i = i[(ay[i] < ay[i - 1]) & (ay[i] <= ay[i + 1]) & (s[i - 1] == s[i]) & (s[i] == s[i + 1]) & (s[i] != 0)]
+    d1 = (y[i + 1] - y[i - 1])/2
+    d2 = y[i + 1] - 2 * y[i] + y[i - 1]
+    vertex = s[i] * (y[i] - d1**2/(2 * d2))
+    touch = i[(vertex <= 0.25 * ay[i]) | (ay[i] <= np.sqrt(np.finfo(float).eps) * ay.max())]
+
+    if method == 'bisection' and vectorized and not kwargs:
+        refined, _, converged = BatchBisection(f, lo, hi, error).solve()
+        # Lanes stopped by a bracket that cannot be halved are judged by
+        # their residual like the scalar refinements.
+        if not converged.all():
+            converged[~converged] = _is_root(np.abs(f(refined[~converged])), error)
+        refined = refined[converged]
+    else:
+        jobs = [(METHODS[method], f, float(l), float(h), error, kwargs) for l, h in zip(lo, hi)]
+        refined = [r for r, residual in _map(_refine, jobs, executor, max_workers) if _is_root(residual, error)]
+    roots.extend(refined)
+
+    if vectorized or executor is None:
+        xm, fm = _golden_min(f, x[touch - 1], x[touch + 1], vectorized)
+    else:
+        jobs = [(f, x[j - 1], x[j + 1]) for j in touch]
+        xm, fm = np.array(_map(_minimize, jobs, executor, max_workers)).reshape(-1, 2).T
+    roots.extend(xm[np.abs(fm) < error])
+
+    return _dedupe(np.sort(np.asarray(roots, dtype=float)), (b - a)/(n - 1))
+
+
+async def afind_roots(
+    f: callable,
+    a: Union[int, float],
+    b: Union[int, float],
+    n: Optional[int] = None,
+    error: Optional[Union[int, float]] = None,
+    method: str = 'brent',
+    limit: Optional[int] = None,
+    **kwargs
+) -> np.ndarray:
+    """Coroutine version of `find_roots` for an f that returns awaitables.
+
+        The grid is sampled with all points in flight at once and every
+        bracket is refined by its own concurrent solve, with at most `limit`
+        evaluations of f outstanding at any time. Roots of even
+        multiplicity are not searched for, as that needs a sequential
+        minimization per candidate; only grid points where f is exactly
+        zero and refined sign changes with a small residual are reported.
+
+    """
+    assert isinstance(a, (int, float)) and isinstance(b, (int, float)) and a < b, "a and b must be numbers with a < b"
+    assert method in METHODS, f"method must be one of {list(METHODS)}"
+    assert limit is None or (isinstance(limit, int) and limit > 0), "limit must be a positive int"
+
+    if n is None:
+        n = 1001
+    assert isinstance(n, int) and n >= 3, "n must be an int of at least 3"
+
+    if error is None:
+        error = 1e-12
+
+    semaphore = None if limit is None else asyncio.Semaphore(limit)
+
+    x = np.linspace(a, b, n)
+    y = np.array(await evaluate_async(f, tuple(x.tolist()), semaphore), dtype=float)
+    s = np.sign(y)
+
+    roots = list(x[s == 0])
+
+    change = np.flatnonzero(s[:-1] * s[1:] < 0)
+    solvers = [METHODS[method](f, float(x[i]), float(x[i + 1]), error, **kwargs) for i in change]
+    results = await asyncio.gather(*[r.arun(semaphore=semaphore) for r in solvers])
+    roots.extend(r.root for r in results if _is_root(r.residual, error))
+
+    return _dedupe(np.sort(np.asarray(roots, dtype=float)), (b - a)/(n - 1))
+
+
+def _sample(f: callable, x: np.ndarray) -> tuple[np.ndarray, bool]:
+
+    try:
+        y = np.asarray(f(x), dtype=float)
+        if y.shape == x.shape:
+            return y, True
+    except (TypeError, ValueError):
+        pass
+
+    return np.array([f(xi) for xi in x], dtype=float), False
+
+
+def _map(fn: callable, jobs: list, executor: Optional[str], max_workers: Optional[int]) -> list:
+
+    if executor is None or not jobs:
+        return list(map(fn, jobs))
+
+    pool = ThreadPoolExecutor if executor == 'thread' else ProcessPoolExecutor
+    with pool(max_workers=max_workers) as p:
+        return list(p.map(fn, jobs))
+
+
+def _refine(job: tuple) -> tuple[float, float]:
+    cls, f, lo, hi, error, kwargs = job
+    result = cls(f, lo, hi, error, **kwargs).run()
+    return result.root, result.residual
+
+
+def _is_root(residual: float, error: float) -> bool:
+    # A sign change at a pole or a jump also closes the bracket, only with
+    # |f| large at its end, so the residual decides what counts as a root.
+    return residual <= 100 * error
+
+
+def _minimize(job: tuple) -> tuple[float, float]:
+    f, lo, hi = job
+    xm, fm = _golden_min(f, np.array([lo]), np.array([hi]), False)
+    return xm[0], fm[0]
+
+
+def _evaluate(f: callable, x: np.ndarray, vectorized: bool) -> np.ndarray:
+    if vectorized:
+        return np.asarray(f(x), dtype=float)
+    return np.array([f(xi) for xi in x], dtype=float)
+
+
+def _golden_min(f: callable, lo: np.ndarray, hi: np.ndarray, vectorized: bool) -> tuple[np.ndarray, np.ndarray]:
+
+    # Golden section search on |f| in every interval at once, each step
+    # evaluates f at one new point per interval.
+    invphi = (np.sqrt(5) - 1)/2
+    c = hi - invphi * (hi - lo)
+    d = lo + invphi * (hi - lo)
+    fc = np.abs(_evaluate(f, c, vectorized))
+    fd = np.abs(_evaluate(f, d, vectorized))
+
+    # |f| is only resolved to about sqrt(eps) around a touching root.
+    tol = np.sqrt(np.finfo(float).eps) * np.maximum(1.0, np.maximum(np.abs(lo), np.abs(hi)))
+    while np.any(hi - lo > tol):
+        left = fc < fd
+        lo = np.where(left, lo, c)
+        hi = np.where(left, d, hi)
+        x = np.where(left, hi - invphi * (hi - lo), lo + invphi * (hi - lo))
+        fx = np.abs(_evaluate(f, x, vectorized))
+        c, d = np.where(left, x, d), np.where(left, c, x)
+        fc, fd = np.where(left, fx, fd), np.where(left, fc, fx)
+
+    xm = (lo + hi)/2
+    return xm, _evaluate(f, xm, vectorized)
+
+
+def _dedupe(roots: np.ndarray, spacing: float) -> np.ndarray:
+
+    if len(roots) < 2:
+        return roots
+
+    # The same root can come from a grid point and a neighbouring bracket.
+    keep = np.diff(roots) > 1e-3 * spacing
+    return roots[np.concatenate(([True], keep))]
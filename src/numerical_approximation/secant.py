@@ -1,14 +1,23 @@
 import time
 import numpy as np
-import matplotlib.pyplot as plt
-from typing import Optional, Union
+from typing import TYPE_CHECKING, Iterator, Optional, Union
+
+from .history import History
+from .root_finder import Evaluate, RootFinder
+from .plotting import plot_history
+
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+    from matplotlib.figure import Figure
 
 """
 @author Jeremy Hopkins
 @author Iris Yang
-@version 0.1.3
+@version 0.2.0
 """
-class Secant():
+class Secant(RootFinder):
+
+    __slots__ = ("a", "b")
 
     def __init__(
         self, 
@@ -18,7 +27,9 @@ class Secant():
         error: Optional[Union[int, float]] = None,
         string_func: Optional[str] = None,
         func_solution: Optional[float] = None,
-        txt_pos: Optional[str] = 'bottom right'
+        txt_pos: Optional[str] = 'bottom right',
+        max_iter: Optional[int] = None,
+        history: Union[str, int] = 'full'
     ):
         """Construct `Secant`
         
@@ -30,12 +41,16 @@ class Secant():
                 string_func: String representation of function being estimated.
                 func_sol: The true soltion to the function.
                 txt_pos: Positioning for txt plotting.
+                max_iter: Maximum number of approximations.
+                history: 'full' to keep every approximation, an int k to keep
+                    the last k, or 'off'.
 
         """
         
         self.count = 0
-        self.approx_vals = []
+        self.nfev = 0
         self.solution = 0
+        self.result = None
 
         assert callable(f), "f must be callable"
         self.f = f
@@ -54,7 +69,8 @@ class Secant():
         assert isinstance(error, (int, float)), "error must be int or float type"
         self.error = error
 
-        assert isinstance(string_func, str), "string_func must be string representation of function"
+        if string_func is not None:
+            assert isinstance(string_func, str), "string_func must be string representation of function"
         self.string_func = string_func
 
         if func_solution is not None:
@@ -64,58 +80,39 @@ class Secant():
         assert isinstance(txt_pos, str), "txt_pos must be a string"
         self.txt_pos = txt_pos
 
+        if max_iter is None:
+            max_iter = 1000
 
-    def solve(self) -> float:
+        assert isinstance(max_iter, int) and max_iter > 0, "max_iter must be a positive int"
+        self.max_iter = max_iter
 
-        if (self.f(self.a) * self.f(self.b) >= 0):
-            raise Exception(f"root not in range [{self.a}, {self.b}]")
+        self.history = History(history)
 
-        self.count = 0
-        self.approx_vals = []
 
-        self.solution = self.method(self.f, self.a, self.b)
-        return self.solution
+    def _iterations(self) -> Iterator[Union[Evaluate, tuple[float, float]]]:
+        return self.method(self.a, self.b)
 
         
-    def method(self, f, a, b):
+    def method(self, a, b) -> Iterator[Union[Evaluate, tuple[float, float]]]:
 
-        self.count += 1
+        fa, fb = yield Evaluate(a, b)
 
-        x = a - (f(a) * ((b - a)/(f(a) - f(b))))
+        if (fa * fb >= 0):
+            raise Exception(f"root not in range [{a}, {b}]")
 
-        self.approx_vals.append(x)
-        
-        if (np.abs(f(x)) < self.error):
-            return x
-
-        if ((f(a) * f(x)) < 0):
-            return self.method(f, a, x)
-
-        if ((f(b) * f(x)) < 0):
-            return self.method(f, x, b)
-
-
-    def plot_solution(self) -> tuple[plt.Figure, plt.Axes]:
-        fig, ax = plt.subplots()
-        fig.set_size_inches(11, 8.5)
-        if self.string_func is not None:
-            ax.set_title("Secant Method for " + self.string_func)
-        else:
-            ax.set_title("Secant Method")
-        ax.set_xlabel("Number of Computations")
-        ax.set_ylabel("Approximation")
-        if self.txt_pos == 'bottom right':
-            ax.text(0.9675, 0.065, f'Target Solution: {self.func_solution:.1f}', ha='right', va='bottom', transform=ax.transAxes)
-        if self.txt_pos == 'bottom left':
-            ax.text(0.25, 0.065, f'Target Solution: {self.func_solution:.1f}', ha='right', va='bottom', transform=ax.transAxes)
-        if self.txt_pos == 'top left':
-            ax.text(0.25, 0.935, f'Target Solution: {self.func_solution:.1f}', ha='right', va='bottom', transform=ax.transAxes)
-        if self.txt_pos == 'top right':
-            ax.text(0.9675, 0.935, f'Target Solution: {self.func_solution:.1f}', ha='right', va='bottom', transform=ax.transAxes)
-        ax.plot(range(len(self.approx_vals)), self.approx_vals, label='Approximation')
-        ax.scatter(range(len(self.approx_vals)), self.approx_vals, s=5)
-        if self.func_solution is not None:
-            ax.axhline(y=self.solution, color='lightgreen', linestyle='-', label='Solution')
-        ax.legend()
-        
-        return fig, ax
\ No newline at end of file
+        while True:
+            x = a - (fa * ((b - a)/(fa - fb)))
+            fx, = yield Evaluate(x)
+
+            yield x, fx
+
+            if ((fa * fx) < 0):
+                b, fb = x, fx
+            elif ((fb * fx) < 0):
+                a, fa = x, fx
+            else:
+                return
+
+
+    def plot_solution(self, ax: Optional["Axes"] = None) -> tuple["Figure", "Axes"]:
+        return plot_history(self, "Secant Method", "Number of Computations", self.solution, ax)
@@ -1,14 +1,23 @@
 import numpy as np
-import matplotlib.pyplot as plt
-from scipy.misc import derivative
-from typing import Optional, Union
+from typing import TYPE_CHECKING, Iterator, Optional, Union
+
+from .basin import BasinMap, basin_map
+from .history import History
+from .root_finder import Evaluate, RootFinder
+from .plotting import plot_history
+
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+    from matplotlib.figure import Figure
 
 """
 @author Jeremy Hopkins
 @author Iris Yang
-@version 0.2.1
+@version 0.2.6
 """
-class Steffensen():
+class Steffensen(RootFinder):
+
+    __slots__ = ("x",)
 
     def __init__(
         self, 
@@ -17,7 +26,9 @@ class Steffensen():
         error: Optional[Union[int, float]] = None,
         string_func: Optional[str] = None,
         func_solution: Optional[float] = None,
-        txt_pos: Optional[str] = 'bottom right'
+        txt_pos: Optional[str] = 'bottom right',
+        max_iter: Optional[int] = None,
+        history: Union[str, int] = 'full'
     ):
         """Construct `Steffensen`
         
@@ -28,12 +39,16 @@ class Steffensen():
                 string_func: String representation of function being estimated.
                 func_sol: The true soltion to the function.
                 txt_pos: Positioning for txt plotting.
+                max_iter: Maximum number of approximations.
+                history: 'full' to keep every approximation, an int k to keep
+                    the last k, or 'off'.
 
         """
 
         self.count = 0
-        self.approx_vals = []
+        self.nfev = 0
         self.solution = 0
+        self.result = None
 
         assert callable(f), "f must be callable"
         self.f = f
@@ -58,54 +73,40 @@ class Steffensen():
         assert isinstance(txt_pos, str), "txt_pos must be a string"
         self.txt_pos = txt_pos
 
-        
-    def solve(self) -> float:
+        if max_iter is None:
+            max_iter = 1000
 
-        self.count = 0
-        self.approx_vals = []
+        assert isinstance(max_iter, int) and max_iter > 0, "max_iter must be a positive int"
+        self.max_iter = max_iter
 
-        self.solution = self.method(self.f, self.x)
-        return self.solution
+        self.history = History(history)
 
         
-    def method(self, f, x):
-
-        self.count += 1
+    def _iterations(self) -> Iterator[Union[Evaluate, tuple[float, float]]]:
+        return self.method(self.x)
 
-        if(np.abs(f(x)) < self.error):
-            return x
         
-        g = f(x + f(x))/f(x) - 1
-
-        x_n = x - f(x)/g
-
-        self.approx_vals.append(x_n)
-
-        return self.method(f, x_n)
-
-
-    def plot_solution(self) -> tuple[plt.Figure, plt.Axes]:
-        fig, ax = plt.subplots()
-        fig.set_size_inches(11, 8.5)
-        if self.string_func is not None:
-            ax.set_title("Steffensen Method for " + self.string_func)
-        else:
-            ax.set_title("Steffensen Method")
-        ax.set_xlabel("Num Computations")
-        ax.set_ylabel("Approximation")
-        if self.txt_pos == 'bottom right':
-            ax.text(0.9675, 0.065, f'Target Solution: {self.func_solution:.1f}', ha='right', va='bottom', transform=ax.transAxes)
-        if self.txt_pos == 'bottom left':
-            ax.text(0.25, 0.065, f'Target Solution: {self.func_solution:.1f}', ha='right', va='bottom', transform=ax.transAxes)
-        if self.txt_pos == 'top left':
-            ax.text(0.25, 0.935, f'Target Solution: {self.func_solution:.1f}', ha='right', va='bottom', transform=ax.transAxes)
-        if self.txt_pos == 'top right':
-            ax.text(0.9675, 0.935, f'Target Solution: {self.func_solution:.1f}', ha='right', va='bottom', transform=ax.transAxes)
-        ax.plot(range(len(self.approx_vals)), self.approx_vals, label='Approximation')
-        ax.scatter(range(len(self.approx_vals)), self.approx_vals, s=5)
-        if self.func_solution is not None:
-            ax.axhline(y=self.solution, color='lightgreen', linestyle='-', label='Solution')
-        ax.legend()
-        
-        return fig, ax
+    def method(self, x) -> Iterator[Union[Evaluate, tuple[float, float]]]:
+
+        while True:
+            fx, = yield Evaluate(x)
+
+            yield x, fx
+
+            fxx, = yield Evaluate(x + fx)
+            g = fxx/fx - 1
+
+            if g == 0:
+                return
+
+            x = x - fx/g
+
+
+    def basin_map(self, starts: np.ndarray, **kwargs) -> BasinMap:
+        """Run this method from every point of `starts`, see `basin.basin_map`."""
+        return basin_map(self.f, starts, 'steffensen', self.error, self.max_iter, **kwargs)
+
+
+    def plot_solution(self, ax: Optional["Axes"] = None) -> tuple["Figure", "Axes"]:
+        return plot_history(self, "Steffensen Method", "Num Computations", self.solution, ax)
         
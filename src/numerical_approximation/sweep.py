@@ -0,0 +1,179 @@
+import argparse
+import csv
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+import numpy as np
+
+from .main import (
+    secant_test, bisection_test, false_position_test, newton_test, steffensen_test, horner_test
+)
+from .plotting import render_each, render_grid
+
+"""
+@author Jeremy Hopkins
+@author Iris Yang
+@version 0.1.0
+"""
+# Test functions live at module level so they can be pickled into worker
+# processes, lambdas cannot.
+def square_minus_two(x):
+    return x**2 - 2
+
+
+def cube(x):
+    return x**3 - 0
+
+
+def square_minus_three(x):
+    return x**2 - 3
+
+
+PROBLEMS = {
+    "x²-2": dict(f=square_minus_two, a=0, b=2, x=1, sol=np.sqrt(2), txt_pos='bottom right'),
+    "x³": dict(f=cube, a=-0.5, b=0.5, x=0.5, sol=0.0, txt_pos='bottom left'),
+    "x²-3": dict(f=square_minus_three, a=1, b=2, x=2, sol=np.sqrt(3), txt_pos='bottom right'),
+}
+
+POLYNOMIALS = {
+    r"$8x^4-8x^2-1$": dict(polynomial=[8, 0, -8, 0, 1], a=-1.1, b=1.1, step=0.001),
+    r"$x^4-\frac{6}{7}x^2-\frac{3}{35}$": dict(polynomial=[1, 0, -6/7, 0, 3/35], a=-1.1, b=1.1, step=0.01),
+}
+
+BRACKETED = {
+    "secant": secant_test,
+    "bisection": bisection_test,
+    "false_position": false_position_test,
+}
+
+OPEN = {
+    "newton": newton_test,
+    "steffensen": steffensen_test,
+}
+
+METHODS = list(BRACKETED) + list(OPEN) + ["horner"]
+
+COLUMNS = ["method", "function", "tolerance", "solution", "error", "count", "nfev", "status", "time"]
+
+
+def _run_job(job: tuple) -> dict:
+    method, name, tol = job
+
+    try:
+        if method == "horner":
+            p = POLYNOMIALS[name]
+            return horner_test(p["polynomial"], p["a"], p["b"], tol, p["step"], name, plot=False, verbose=False)
+
+        p = PROBLEMS[name]
+        if method in BRACKETED:
+            return BRACKETED[method](p["f"], p["a"], p["b"], tol, name, p["sol"], p["txt_pos"], plot=False, verbose=False)
+        return OPEN[method](p["f"], p["x"], tol, name, p["sol"], p["txt_pos"], plot=False, verbose=False)
+
+    except Exception as e:
+        return {"method": method, "function": name, "tolerance": tol, "status": f"{type(e).__name__}: {e}"}
+
+
+def jobs(methods: list[str], tolerances: list[float]) -> list[tuple]:
+    """Return the (method, function, tolerance) matrix to run."""
+    out = []
+    for method in methods:
+        names = POLYNOMIALS if method == "horner" else PROBLEMS
+        out.extend(itertools.product([method], names, tolerances))
+
+    return out
+
+
+def run_sweep(
+    methods: Optional[list[str]] = None,
+    tolerances: Optional[list[float]] = None,
+    max_workers: Optional[int] = None
+) -> list[dict]:
+    """Run every job on a process pool and return one row per job, in job order."""
+    if methods is None:
+        methods = METHODS
+    if tolerances is None:
+        tolerances = [1e-2, 1e-5, 1e-10, 1e-15]
+
+    assert all(m in METHODS for m in methods), f"methods must be in {METHODS}"
+
+    todo = jobs(methods, tolerances)
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(_run_job, todo, chunksize=max(1, len(todo) // (4 * (os.cpu_count() or 1)))))
+
+
+def format_table(rows: list[dict]) -> str:
+
+    def cell(value):
+        if value is None:
+            return "-"
+        if isinstance(value, float):
+            return f"{value:.6g}"
+        if isinstance(value, np.ndarray):
+            return ", ".join(f"{v:.6g}" for v in value)
+        return str(value)
+
+    table = [COLUMNS] + [[cell(row.get(col)) for col in COLUMNS] for row in rows]
+    widths = [max(len(r[i]) for r in table) for i in range(len(COLUMNS))]
+    lines = ["  ".join(c.ljust(w) for c, w in zip(r, widths)) for r in table]
+    lines.insert(1, "  ".join("-" * w for w in widths))
+
+    return "\n".join(lines)
+
+
+def write_csv(rows: list[dict], path: str) -> None:
+    with open(path, "w", newline="") as fh:
+        writer = csv.DictWriter(fh, fieldnames=COLUMNS, extrasaction="ignore")
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def render(rows: list[dict], out_dir: str, grid: bool = False) -> None:
+    """Save the convergence plot of every successful row into `out_dir`.
+
+        All plots are drawn onto one reused figure. With `grid`, each method
+        is instead saved as one figure of small multiples.
+
+    """
+    os.makedirs(out_dir, exist_ok=True)
+
+    rows = [row for row in rows if row.get("solver") is not None]
+
+    if grid:
+        for method in dict.fromkeys(row["method"] for row in rows):
+            items = [_plot_item(row) for row in rows if row["method"] == method]
+            render_grid(items, os.path.join(out_dir, f"{method}.png"))
+        return
+
+    paths = [os.path.join(out_dir, f"{row['method']}_{row['function']}_{row['tolerance']:g}.png") for row in rows]
+    render_each(map(_plot_item, rows), paths)
+
+
+def _plot_item(row: dict):
+
+    solver = row["solver"]
+    if row["method"] != "horner":
+        return solver
+
+    x, y = solver.solve()
+    return lambda ax: solver.plot_solution(x, y, row["solution"], ax=ax)
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description="Run the root finding test matrix on a process pool.")
+    parser.add_argument("--methods", nargs="+", choices=METHODS, default=METHODS)
+    parser.add_argument("--tolerances", nargs="+", type=float, default=[1e-2, 1e-5, 1e-10, 1e-15])
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--csv", default=None, help="write the result table to this file")
+    parser.add_argument("--render", default=None, help="save figures into this directory")
+    parser.add_argument("--grid", action="store_true", help="render one figure of small multiples per method")
+    args = parser.parse_args()
+
+    rows = run_sweep(args.methods, args.tolerances, args.workers)
+    print(format_table(rows))
+
+    if args.csv is not None:
+        write_csv(rows, args.csv)
+    if args.render is not None:
+        render(rows, args.render, args.grid)